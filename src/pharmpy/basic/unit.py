@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from threading import Lock
 from typing import Union
 
 from pharmpy.deps import sympy, sympy_printing
@@ -12,11 +13,14 @@ class Unit:
         if isinstance(source, Unit):
             self._expr = source._expr
         else:
-            self._expr = sympy.sympify(source).subs(_unit_subs())
+            expr = sympy.sympify(source)
+            # NOTE: Only substitute the symbols present. xreplace cannot be used since it
+            # would also replace the name symbols inside of already created quantities.
+            unit_subs = _unit_subs()
+            self._expr = expr.subs({s: unit_subs[s] for s in expr.free_symbols if s in unit_subs})
 
     def unicode(self) -> str:
-        printer = UnitPrinter()
-        return printer._print(self._expr)
+        return _unit_printer._print(self._expr)
 
     def serialize(self) -> str:
         return sympy.srepr(self._expr)
@@ -27,7 +31,11 @@ class Unit:
 
     @classmethod
     def unitless(cls) -> Unit:
-        return cls("1")
+        # NOTE: Same as cls("1") without parsing the string. This is used for
+        # every data column without a unit.
+        unit = cls.__new__(cls)
+        unit._expr = sympy.S.One
+        return unit
 
     def __eq__(self, other):
         return isinstance(other, Unit) and self._expr == other._expr or self._expr == other
@@ -46,19 +54,22 @@ class Unit:
 TUnit = str | Unit
 
 _unit_subs_cache = None
+_unit_subs_lock = Lock()
 
 
 def _unit_subs():
     global _unit_subs_cache
     if _unit_subs_cache is None:
-        subs = {}
-        import sympy.physics.units as units
+        with _unit_subs_lock:
+            if _unit_subs_cache is None:
+                subs = {}
+                import sympy.physics.units as units
 
-        for k, v in units.__dict__.items():
-            if isinstance(v, sympy.Expr) and v.has(units.Unit):
-                subs[sympy.Symbol(k)] = v
+                for k, v in units.__dict__.items():
+                    if isinstance(v, sympy.Expr) and v.has(units.Unit):
+                        subs[sympy.Symbol(k)] = v
 
-        _unit_subs_cache = subs
+                _unit_subs_cache = subs
 
     return _unit_subs_cache
 
@@ -67,8 +78,9 @@ class UnitPrinter(sympy_printing.str.StrPrinter):
     """Print physical unit as unicode"""
 
     def _print_Mul(self, expr):
-        pow_strings = [self._print(e) for e in expr.args if e.is_Pow]
-        plain_strings = [self._print(e) for e in expr.args if not e.is_Pow]
+        pow_strings, plain_strings = [], []
+        for e in expr.args:
+            (pow_strings if e.is_Pow else plain_strings).append(self._print(e))
         all_strings = sorted(plain_strings) + sorted(pow_strings)
         return '⋅'.join(all_strings)
 
@@ -89,6 +101,9 @@ class UnitPrinter(sympy_printing.str.StrPrinter):
             return str(expr.args[1])
 
 
+_unit_printer = UnitPrinter()
+
+
 class Quantity:
     def __init__(self, value: float, unit: Unit):
         self._value = value
@@ -1,6 +1,7 @@
 import math
 
 from pharmpy.deps import numpy as np
+from pharmpy.deps import pandas as pd
 from pharmpy.deps import sympy
 from pharmpy.internals.expr.subs import subs
 
@@ -54,17 +55,12 @@ def round_and_keep_sum(x, s):
     Algorithm: Floor all elements in series. If sum not correct add one to element with
                highest fractional part until sum is reached.
     """
-    sorted_fractions = x.apply(lambda x: math.modf(x)[0]).sort_values(ascending=False)
-    rounded_sample_sizes = x.apply(lambda x: math.modf(x)[1])
-    for group_index, _ in sorted_fractions.items():
-        num_samples = rounded_sample_sizes.sum()
-        diff = s - num_samples
-        if diff == 0:
-            break
-        step = math.copysign(1, diff)
-        rounded_sample_sizes[group_index] += step
-
-    return rounded_sample_sizes.astype('int64')
+    fractions, integers = np.modf(x.to_numpy(dtype=np.float64))
+    order = pd.Series(fractions).sort_values(ascending=False).index.to_numpy()
+    diff = int(s - integers.sum())
+    n = min(abs(diff), len(order))
+    integers[order[:n]] += math.copysign(1, diff)
+    return pd.Series(integers, index=x.index, name=x.name).astype('int64')
 
 
 def se_delta_method(expr, values, cov):
@@ -7,6 +7,9 @@ from lark.tree import Meta
 WS = {' ', '\x00', '\t'}
 LF = {'\r', '\n'}
 
+# NOTE: Reading the package metadata is slow so it is only done once
+_LARK_END_POS_WORKAROUND = version('lark') == '1.1.6'
+
 
 def _tokenize_ignored_characters(s: str, i: int, j: int) -> Iterable[Token]:
     # TODO: Propagate line/column information
@@ -49,7 +52,7 @@ def _item_range(x: Union[Tree, Token]) -> tuple[int, int]:
     if isinstance(x, Tree):
         i = x.meta.start_pos
         j = x.meta.end_pos
-        if version('lark') == '1.1.6':
+        if _LARK_END_POS_WORKAROUND:
             j = _get_new_end_pos(x)
     else:
         i = x.start_pos
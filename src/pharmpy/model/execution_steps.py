@@ -9,6 +9,8 @@ from pharmpy.deps import pandas as pd
 from pharmpy.internals.immutable import Immutable, frozenmapping
 
 SUPPORTED_SOLVERS = frozenset(('CVODES', 'DGEAR', 'DVERK', 'IDA', 'LSODA', 'LSODI'))
+SUPPORTED_METHODS = frozenset(('FO', 'FOCE', 'ITS', 'IMPMAP', 'IMP', 'SAEM', 'BAYES'))
+SUPPORTED_PARAMETER_UNCERTAINTY_METHODS = frozenset(('SANDWICH', 'SMAT', 'RMAT', 'EFIM'))
 
 
 class ExecutionStep(Immutable):
@@ -123,8 +125,8 @@ class EstimationStep(ExecutionStep):
 
     """Supported estimation methods
     """
-    supported_methods = frozenset(('FO', 'FOCE', 'ITS', 'IMPMAP', 'IMP', 'SAEM', 'BAYES'))
-    supported_parameter_uncertainty_methods = frozenset(('SANDWICH', 'SMAT', 'RMAT', 'EFIM'))
+    supported_methods = SUPPORTED_METHODS
+    supported_parameter_uncertainty_methods = SUPPORTED_PARAMETER_UNCERTAINTY_METHODS
 
     def __init__(
         self,
@@ -219,12 +221,11 @@ class EstimationStep(ExecutionStep):
             parameter_uncertainty_method = parameter_uncertainty_method.upper()
         if not (
             parameter_uncertainty_method is None
-            or parameter_uncertainty_method
-            in EstimationStep.supported_parameter_uncertainty_methods
+            or parameter_uncertainty_method in SUPPORTED_PARAMETER_UNCERTAINTY_METHODS
         ):
             raise ValueError(
                 f"Unknown parameter uncertainty method {parameter_uncertainty_method}. "
-                f"Recognized methods are {sorted(EstimationStep.supported_parameter_uncertainty_methods)}."
+                f"Recognized methods are {sorted(SUPPORTED_PARAMETER_UNCERTAINTY_METHODS)}."
             )
         solver = ExecutionStep._canonicalize_solver(solver)
         tool_options = ExecutionStep._canonicalize_tool_options(tool_options)
@@ -259,9 +260,9 @@ class EstimationStep(ExecutionStep):
     @staticmethod
     def _canonicalize_and_check_method(method: str) -> str:
         method = method.upper()
-        if method not in EstimationStep.supported_methods:
+        if method not in SUPPORTED_METHODS:
             raise ValueError(
-                f'EstimationStep: {method} not recognized. Use any of {sorted(EstimationStep.supported_methods)}.'
+                f'EstimationStep: {method} not recognized. Use any of {sorted(SUPPORTED_METHODS)}.'
             )
         return method
 
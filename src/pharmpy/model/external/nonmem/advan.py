@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import re
 import warnings
-from typing import TYPE_CHECKING, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Optional
 
 from pharmpy.basic import BooleanExpr, Expr
 from pharmpy.deps import sympy
@@ -39,255 +41,227 @@ def _compartmental_model(
     trans,
     des=None,
 ):
-    if advan == 'ADVAN1':
-        # FIXME: Require multiple doses per comp before IV+ORAL
-        doses = dosing(di, dataset, 1)
-        cb = CompartmentalSystemBuilder()
-        central = Compartment.create(
-            'CENTRAL',
-            doses=find_dose(doses, comp_number=1),
-            lag_time=_get_alag(control_stream, 1),
-            bioavailability=_get_bioavailability(control_stream, 1),
-        )
-        cb.add_compartment(central)
-        cb.add_flow(central, output, _advan1and2_trans(trans))
-        comp_map = {'CENTRAL': 1, 'OUTPUT': 2}
-        ass = _f_link_assignment(control_stream, di, dataset, comp_map, central, 1)
-    elif advan == 'ADVAN2':
-        doses = dosing(di, dataset, 1)
-        cb = CompartmentalSystemBuilder()
-        depot = Compartment.create(
-            'DEPOT',
-            doses=find_dose(doses, comp_number=1),
-            lag_time=_get_alag(control_stream, 1),
-            bioavailability=_get_bioavailability(control_stream, 1),
-        )
-        central = Compartment.create(
-            'CENTRAL',
-            doses=find_dose(doses, comp_number=2),
-            lag_time=_get_alag(control_stream, 2),
-            bioavailability=_get_bioavailability(control_stream, 2),
-        )
-        cb.add_compartment(depot)
-        cb.add_compartment(central)
-        cb.add_flow(central, output, _advan1and2_trans(trans))
-        cb.add_flow(depot, central, Expr.symbol('KA'))
-        comp_map = {'DEPOT': 1, 'CENTRAL': 2, 'OUTPUT': 3}
-        ass = _f_link_assignment(control_stream, di, dataset, comp_map, central, 2)
-    elif advan == 'ADVAN3':
-        # FIXME: Multiple doses per compartment IV+ORAL
-        doses = dosing(di, dataset, 1)
-        cb = CompartmentalSystemBuilder()
-        central = Compartment.create(
-            'CENTRAL',
-            doses=find_dose(doses, comp_number=1),
-            lag_time=_get_alag(control_stream, 1),
-            bioavailability=_get_bioavailability(control_stream, 1),
-        )
-        peripheral = Compartment.create(
-            'PERIPHERAL',
-            doses=tuple(),
-            lag_time=_get_alag(control_stream, 2),
-            bioavailability=_get_bioavailability(control_stream, 2),
-        )
-        cb.add_compartment(central)
-        cb.add_compartment(peripheral)
-        k, k12, k21 = _advan3_trans(trans)
-        cb.add_flow(central, output, k)
-        cb.add_flow(central, peripheral, k12)
-        cb.add_flow(peripheral, central, k21)
-        comp_map = {'CENTRAL': 1, 'PERIPHERAL': 2, 'OUTPUT': 3}
-        ass = _f_link_assignment(control_stream, di, dataset, comp_map, central, 1)
-    elif advan == 'ADVAN4':
-        doses = dosing(di, dataset, 1)
-        cb = CompartmentalSystemBuilder()
-        depot = Compartment.create(
-            'DEPOT',
-            doses=find_dose(doses, comp_number=1),
-            lag_time=_get_alag(control_stream, 1),
-            bioavailability=_get_bioavailability(control_stream, 1),
-        )
-        central = Compartment.create(
-            'CENTRAL',
-            doses=find_dose(doses, comp_number=2),
-            lag_time=_get_alag(control_stream, 2),
-            bioavailability=_get_bioavailability(control_stream, 2),
-        )
-        peripheral = Compartment.create(
-            'PERIPHERAL',
-            doses=tuple(),
-            lag_time=_get_alag(control_stream, 3),
-            bioavailability=_get_bioavailability(control_stream, 3),
-        )
-        cb.add_compartment(depot)
-        cb.add_compartment(central)
-        cb.add_compartment(peripheral)
-        k, k23, k32, ka = _advan4_trans(trans)
-        cb.add_flow(depot, central, ka)
-        cb.add_flow(central, output, k)
-        cb.add_flow(central, peripheral, k23)
-        cb.add_flow(peripheral, central, k32)
-        comp_map = {'DEPOT': 1, 'CENTRAL': 2, 'PERIPHERAL': 3, 'OUTPUT': 4}
-        ass = _f_link_assignment(control_stream, di, dataset, comp_map, central, 2)
+    topology = _ADVAN_TOPOLOGIES.get(advan)
+    if topology is None and advan not in ('ADVAN5', 'ADVAN7') and not des:
+        return None
+    # NOTE: Names assigned in $PK are collected once and used for all
+    # ALAGn and Fn checks below
+    pk_names = _get_pk_assigned_names(control_stream)
+    if topology is not None:
+        cb, ass, comp_map = _build_advan(topology, di, dataset, pk_names, trans)
     elif advan == 'ADVAN5' or advan == 'ADVAN7':
-        cb = CompartmentalSystemBuilder()
-
-        defobs, defdose, comp_map = parse_model_record(control_stream)
-
-        doses = dosing(di, dataset, defdose[1])
-        obscomp = None
-        compartments = []
-        for i, name in enumerate(comp_map.keys(), start=1):
-            curdose = find_dose(doses, i)
-            comp = Compartment.create(
-                name,
-                doses=curdose,
-                lag_time=_get_alag(control_stream, i),
-                bioavailability=_get_bioavailability(control_stream, i),
-            )
-            cb.add_compartment(comp)
-            compartments.append(comp)
-            if name == defobs[0]:
-                obscomp = comp
-        compartments.append(output)
-
-        assert obscomp is not None
-        for from_n, to_n, rate in _find_rates(control_stream, len(compartments)):
-            cb.add_flow(compartments[from_n - 1], compartments[to_n - 1], rate)
-        ass = _f_link_assignment(control_stream, di, dataset, comp_map, obscomp, defobs[1])
-    elif advan == 'ADVAN10':
-        # FIXME: Multiple doses per compartment needed
-        doses = dosing(di, dataset, 1)
-        cb = CompartmentalSystemBuilder()
-        central = Compartment.create(
-            'CENTRAL',
-            doses=find_dose(doses, comp_number=1),
-            lag_time=_get_alag(control_stream, 1),
-            bioavailability=_get_bioavailability(control_stream, 1),
-        )
-        cb.add_compartment(central)
-        vm = Expr.symbol('VM')
-        km = Expr.symbol('KM')
-        cb.add_flow(central, output, vm / (km + Expr.function(central.amount.name, 't')))
-        comp_map = {'CENTRAL': 1, 'OUTPUT': 2}
-        ass = _f_link_assignment(control_stream, di, dataset, comp_map, central, 1)
-    elif advan == 'ADVAN11':
-        doses = dosing(di, dataset, 1)
-        cb = CompartmentalSystemBuilder()
-        central = Compartment.create(
-            'CENTRAL',
-            doses=find_dose(doses, comp_number=1),
-            lag_time=_get_alag(control_stream, 1),
-            bioavailability=_get_bioavailability(control_stream, 1),
-        )
-        per1 = Compartment.create(
-            'PERIPHERAL1',
-            doses=tuple(),
-            lag_time=_get_alag(control_stream, 2),
-            bioavailability=_get_bioavailability(control_stream, 2),
-        )
-        per2 = Compartment.create(
-            'PERIPHERAL2',
-            doses=tuple(),
-            lag_time=_get_alag(control_stream, 3),
-            bioavailability=_get_bioavailability(control_stream, 3),
-        )
-        cb.add_compartment(central)
-        cb.add_compartment(per1)
-        cb.add_compartment(per2)
-        k, k12, k21, k13, k31 = _advan11_trans(trans)
-        cb.add_flow(central, output, k)
-        cb.add_flow(central, per1, k12)
-        cb.add_flow(per1, central, k21)
-        cb.add_flow(central, per2, k13)
-        cb.add_flow(per2, central, k31)
-        comp_map = {'CENTRAL': 1, 'PERIPHERAL1': 2, 'PERIPHERAL2': 3, 'OUTPUT': 4}
-        ass = _f_link_assignment(control_stream, di, dataset, comp_map, central, 1)
-    elif advan == 'ADVAN12':
-        doses = dosing(di, dataset, 1)
-        cb = CompartmentalSystemBuilder()
-        depot = Compartment.create(
-            'DEPOT',
-            doses=find_dose(doses, comp_number=1),
-            lag_time=_get_alag(control_stream, 1),
-            bioavailability=_get_bioavailability(control_stream, 1),
-        )
-        central = Compartment.create(
-            'CENTRAL',
-            doses=find_dose(doses, comp_number=2),
-            lag_time=_get_alag(control_stream, 2),
-            bioavailability=_get_bioavailability(control_stream, 2),
-        )
-        per1 = Compartment.create(
-            'PERIPHERAL1',
-            doses=tuple(),
-            lag_time=_get_alag(control_stream, 3),
-            bioavailability=_get_bioavailability(control_stream, 3),
-        )
-        per2 = Compartment.create(
-            'PERIPHERAL2',
-            doses=tuple(),
-            lag_time=_get_alag(control_stream, 4),
-            bioavailability=_get_bioavailability(control_stream, 4),
-        )
-        cb.add_compartment(depot)
-        cb.add_compartment(central)
-        cb.add_compartment(per1)
-        cb.add_compartment(per2)
-        k, k23, k32, k24, k42, ka = _advan12_trans(trans)
-        cb.add_flow(depot, central, ka)
-        cb.add_flow(central, output, k)
-        cb.add_flow(central, per1, k23)
-        cb.add_flow(per1, central, k32)
-        cb.add_flow(central, per2, k24)
-        cb.add_flow(per2, central, k42)
-        comp_map = {'DEPOT': 1, 'CENTRAL': 2, 'PERIPHERAL1': 3, 'PERIPHERAL2': 4, 'OUTPUT': 5}
-        ass = _f_link_assignment(control_stream, di, dataset, comp_map, central, 2)
-    elif des:
-        # FIXME: Add dose based on presence of CMT column
-
-        defobs, defdose, comp_map = parse_model_record(control_stream)
-
-        subs_dict = {}
-        func_to_name = {}
-
-        t = Expr.symbol('t')
-        subs_dict['T'] = t
-        for name, i in comp_map.items():
-            a = Expr.function(f'A_{name}', t)
-            subs_dict[Expr.symbol(f'DADT({i})')] = Expr.derivative(a, t)
-            subs_dict[Expr.symbol(f'DADT ({i})')] = Expr.derivative(a, t)
-            subs_dict[Expr.symbol(f'A({i})')] = a
-            func_to_name[a] = name
-
-        sset = des.statements.subs(subs_dict)
-        eqs = [sympy.Eq(s.symbol, s.expression) for s in sset if s.symbol.is_derivative()]
-
-        cs = to_compartmental_system(func_to_name, eqs)
-        cb = CompartmentalSystemBuilder(cs)
-        doses = dosing(di, dataset, defdose[1])
-        for name, i in comp_map.items():
-            comp = cs.find_compartment(name)
-            if comp is None:  # Compartments can be in $MODEL but not used in $DES
-                continue
-            cb.set_dose(comp, find_dose(doses, i))
-            comp = cb.find_compartment(name)
-            assert comp is not None
-            f = _get_bioavailability(control_stream, i)
-            cb.set_bioavailability(comp, f)
-            comp = cb.find_compartment(name)
-            assert comp is not None
-            alag = _get_alag(control_stream, i)
-            cb.set_lag_time(comp, alag)
-
-        ass = _f_link_assignment(
-            control_stream, di, dataset, comp_map, Expr.symbol(f'A_{defobs[0]}'), defobs[1]
-        )
+        cb, ass, comp_map = _build_general_linear(di, dataset, control_stream, pk_names)
     else:
-        return None
+        cb, ass, comp_map = _build_des(di, dataset, control_stream, pk_names, des)
     return CompartmentalSystem(cb), ass, comp_map
 
 
+def _build_general_linear(
+    di: DataInfo,
+    dataset,
+    control_stream: NMTranControlStream,
+    pk_names: frozenset[str],
+):
+    # ADVAN5 and ADVAN7 with compartments from $MODEL and rates from $PK
+    cb = CompartmentalSystemBuilder()
+
+    defobs, defdose, comp_map = parse_model_record(control_stream)
+
+    doses = dosing(di, dataset, defdose[1])
+    compartments = []
+    for name, i in comp_map.items():
+        curdose = find_dose(doses, i)
+        comp = Compartment.create(
+            name,
+            doses=curdose,
+            lag_time=_get_alag(pk_names, i),
+            bioavailability=_get_bioavailability(pk_names, i),
+        )
+        cb.add_compartment(comp)
+        compartments.append(comp)
+    obscomp = compartments[defobs[1] - 1]
+    compartments.append(output)
+
+    for from_n, to_n, rate in _find_rates(control_stream, len(compartments)):
+        cb.add_flow(compartments[from_n - 1], compartments[to_n - 1], rate)
+    ass = _f_link_assignment(pk_names, di, dataset, comp_map, obscomp, defobs[1])
+    return cb, ass, comp_map
+
+
+def _build_des(
+    di: DataInfo,
+    dataset,
+    control_stream: NMTranControlStream,
+    pk_names: frozenset[str],
+    des,
+):
+    # FIXME: Add dose based on presence of CMT column
+
+    defobs, defdose, comp_map = parse_model_record(control_stream)
+
+    subs_dict, func_to_name = _des_substitutions(comp_map.keys())
+    subs_dict['T'] = Expr.symbol('t')
+
+    sset = des.statements.subs(subs_dict)
+    eqs = [sympy.Eq(s.symbol, s.expression) for s in sset if s.symbol.is_derivative()]
+
+    cs = to_compartmental_system(func_to_name, eqs)
+    cb = CompartmentalSystemBuilder(cs)
+    doses = dosing(di, dataset, defdose[1])
+    for name, i in comp_map.items():
+        comp = cs.find_compartment(name)
+        if comp is None:  # Compartments can be in $MODEL but not used in $DES
+            continue
+        cb.set_dose(comp, find_dose(doses, i))
+        comp = cb.find_compartment(name)
+        assert comp is not None
+        f = _get_bioavailability(pk_names, i)
+        cb.set_bioavailability(comp, f)
+        comp = cb.find_compartment(name)
+        assert comp is not None
+        alag = _get_alag(pk_names, i)
+        cb.set_lag_time(comp, alag)
+
+    ass = _f_link_assignment(
+        pk_names, di, dataset, comp_map, Expr.symbol(f'A_{defobs[0]}'), defobs[1]
+    )
+    return cb, ass, comp_map
+
+
+@dataclass(frozen=True)
+class _AdvanTopology:
+    # Compartment names in NONMEM numbering order. The first n_dosed can
+    # receive doses.
+    compartments: tuple[str, ...]
+    n_dosed: int
+    # (from, to) compartment names in the same order as the rates returned
+    # by rates(trans, compartments)
+    flows: tuple[tuple[str, str], ...]
+    rates: Callable[[str, dict[str, Compartment]], tuple[Expr, ...]]
+
+
+def _build_advan(
+    topology: _AdvanTopology,
+    di: DataInfo,
+    dataset,
+    pk_names: frozenset[str],
+    trans,
+):
+    # FIXME: Require multiple doses per comp before IV+ORAL
+    doses = dosing(di, dataset, 1)
+    cb = CompartmentalSystemBuilder()
+    compartments = {}
+    for i, name in enumerate(topology.compartments, 1):
+        comp = Compartment.create(
+            name,
+            doses=find_dose(doses, comp_number=i) if i <= topology.n_dosed else tuple(),
+            lag_time=_get_alag(pk_names, i),
+            bioavailability=_get_bioavailability(pk_names, i),
+        )
+        cb.add_compartment(comp)
+        compartments[name] = comp
+    compartments['OUTPUT'] = output
+    for (from_name, to_name), rate in zip(
+        topology.flows, topology.rates(trans, compartments), strict=True
+    ):
+        cb.add_flow(compartments[from_name], compartments[to_name], rate)
+    comp_map = {name: i for i, name in enumerate(topology.compartments + ('OUTPUT',), 1)}
+    ass = _f_link_assignment(
+        pk_names, di, dataset, comp_map, compartments['CENTRAL'], comp_map['CENTRAL']
+    )
+    return cb, ass, comp_map
+
+
+def _advan2_rates(trans, compartments):
+    return _advan1and2_trans(trans), Expr.symbol('KA')
+
+
+def _advan4_rates(trans, compartments):
+    k, k23, k32, ka = _advan4_trans(trans)
+    return ka, k, k23, k32
+
+
+def _advan10_rates(trans, compartments):
+    return (_michaelis_menten_rate(compartments['CENTRAL'].amount.name),)
+
+
+@lru_cache(maxsize=None)
+def _michaelis_menten_rate(amount_name: str):
+    # NOTE: The amount name is always the same for ADVAN10 so the rate and
+    # its amount function are only created once
+    vm, km = _symbols('VM', 'KM')
+    return vm / (km + Expr.function(amount_name, 't'))
+
+
+def _advan12_rates(trans, compartments):
+    k, k23, k32, k24, k42, ka = _advan12_trans(trans)
+    return ka, k, k23, k32, k24, k42
+
+
+_ADVAN_TOPOLOGIES = {
+    'ADVAN1': _AdvanTopology(
+        ('CENTRAL',),
+        1,
+        (('CENTRAL', 'OUTPUT'),),
+        lambda trans, _: (_advan1and2_trans(trans),),
+    ),
+    'ADVAN2': _AdvanTopology(
+        ('DEPOT', 'CENTRAL'),
+        2,
+        (('CENTRAL', 'OUTPUT'), ('DEPOT', 'CENTRAL')),
+        _advan2_rates,
+    ),
+    'ADVAN3': _AdvanTopology(
+        ('CENTRAL', 'PERIPHERAL'),
+        1,
+        (('CENTRAL', 'OUTPUT'), ('CENTRAL', 'PERIPHERAL'), ('PERIPHERAL', 'CENTRAL')),
+        lambda trans, _: _advan3_trans(trans),
+    ),
+    'ADVAN4': _AdvanTopology(
+        ('DEPOT', 'CENTRAL', 'PERIPHERAL'),
+        2,
+        (
+            ('DEPOT', 'CENTRAL'),
+            ('CENTRAL', 'OUTPUT'),
+            ('CENTRAL', 'PERIPHERAL'),
+            ('PERIPHERAL', 'CENTRAL'),
+        ),
+        _advan4_rates,
+    ),
+    'ADVAN10': _AdvanTopology(
+        ('CENTRAL',),
+        1,
+        (('CENTRAL', 'OUTPUT'),),
+        _advan10_rates,
+    ),
+    'ADVAN11': _AdvanTopology(
+        ('CENTRAL', 'PERIPHERAL1', 'PERIPHERAL2'),
+        1,
+        (
+            ('CENTRAL', 'OUTPUT'),
+            ('CENTRAL', 'PERIPHERAL1'),
+            ('PERIPHERAL1', 'CENTRAL'),
+            ('CENTRAL', 'PERIPHERAL2'),
+            ('PERIPHERAL2', 'CENTRAL'),
+        ),
+        lambda trans, _: _advan11_trans(trans),
+    ),
+    'ADVAN12': _AdvanTopology(
+        ('DEPOT', 'CENTRAL', 'PERIPHERAL1', 'PERIPHERAL2'),
+        2,
+        (
+            ('DEPOT', 'CENTRAL'),
+            ('CENTRAL', 'OUTPUT'),
+            ('CENTRAL', 'PERIPHERAL1'),
+            ('PERIPHERAL1', 'CENTRAL'),
+            ('CENTRAL', 'PERIPHERAL2'),
+            ('PERIPHERAL2', 'CENTRAL'),
+        ),
+        _advan12_rates,
+    ),
+}
+
+
 def des_assign_statements(
     control_stream: NMTranControlStream,
     des=None,
@@ -295,16 +269,7 @@ def des_assign_statements(
     if des:
         rec_model = control_stream.get_records('MODEL')[0]
 
-        subs_dict = {}
-        comps = [c for c, _ in rec_model.compartments()]
-        func_to_name = {}
-        t = Expr.symbol('t')
-        for i, c in enumerate(comps, 1):
-            a = Expr.function(f'A_{c}', t)
-            subs_dict[Expr.symbol(f'DADT({i})')] = Expr.derivative(a, t)
-            subs_dict[Expr.symbol(f'DADT ({i})')] = Expr.derivative(a, t)
-            subs_dict[Expr.symbol(f'A({i})')] = a
-            func_to_name[a] = c
+        subs_dict, _ = _des_substitutions(c for c, _ in rec_model.compartments())
 
         sset = des.statements.subs(subs_dict)
 
@@ -318,8 +283,25 @@ def des_assign_statements(
         return statements
 
 
+def _des_substitutions(compartment_names):
+    """Substitutions from DADT(n) and A(n) in $DES to derivatives and amount
+    functions of time, and a map from amount functions to compartment names
+    """
+    subs_dict = {}
+    func_to_name = {}
+    t = Expr.symbol('t')
+    for i, name in enumerate(compartment_names, 1):
+        a = Expr.function(f'A_{name}', t)
+        dadt = Expr.derivative(a, t)
+        subs_dict[Expr.symbol(f'DADT({i})')] = dadt
+        subs_dict[Expr.symbol(f'DADT ({i})')] = dadt
+        subs_dict[Expr.symbol(f'A({i})')] = a
+        func_to_name[a] = name
+    return subs_dict, func_to_name
+
+
 def _f_link_assignment(
-    control_stream: NMTranControlStream,
+    pk_names: frozenset[str],
     di: DataInfo,
     dataset,
     comp_map,
@@ -332,14 +314,11 @@ def _f_link_assignment(
     else:
         fexpr = compartment
     ffunc = Expr.function(fexpr.name, 't')
-    pkrec = control_stream.get_records('PK')[0]
     scaling = f'S{compno}'
-    if pkrec.statements.find_assignment(scaling):
+    if scaling in pk_names:
         fexpr = ffunc / Expr.symbol(scaling)
     elif (
-        isinstance(compartment, Compartment)
-        and compartment.name == "CENTRAL"
-        and pkrec.statements.find_assignment("SC")
+        isinstance(compartment, Compartment) and compartment.name == "CENTRAL" and "SC" in pk_names
     ):
         fexpr = ffunc / Expr.symbol("SC")
     else:
@@ -367,7 +346,7 @@ def _f_link_assignment(
                 )
                 func = Expr.function(f'A_{inv_map[val]}', 't')
                 s = f'S{int(val)}'
-                if pkrec.statements.find_assignment(s):
+                if s in pk_names:
                     expr = func / Expr.symbol(s)
                 else:
                     expr = func
@@ -395,12 +374,17 @@ def _find_observation_column(di):
     return label
 
 
+_RATE_PARAMETER_REGEX = re.compile(r'K(\d+)(T\d+)?')
+
+
 def _find_rates(control_stream: NMTranControlStream, ncomps: int):
     pkrec = control_stream.get_records('PK')[0]
     for stat in pkrec.statements:
         if hasattr(stat, 'symbol'):
             name = stat.symbol.name
-            m = re.match(r'^K(\d+)(T\d+)?$', name)
+            if not name.startswith('K'):
+                continue
+            m = _RATE_PARAMETER_REGEX.fullmatch(name)
             if m:
                 if m.group(2):
                     from_n = int(m.group(1))
@@ -443,175 +427,136 @@ def _find_rates(control_stream: NMTranControlStream, ncomps: int):
                 yield from_n, to_n, Expr.symbol(name)
 
 
+def _symbols(*names: str) -> tuple[Expr, ...]:
+    return tuple(Expr.symbol(name) for name in names)
+
+
+# NOTE: The rate expressions only depend on the TRANS and are immutable, so
+# each combination is built once and the same tuple is returned afterwards
+@lru_cache(maxsize=None)
 def _advan1and2_trans(trans: str):
     if trans == 'TRANS2':
-        return Expr.symbol('CL') / Expr.symbol('V')
+        cl, v = _symbols('CL', 'V')
+        return cl / v
     else:  # TRANS1 which is also the default
         return Expr.symbol('K')
 
 
+@lru_cache(maxsize=None)
 def _advan3_trans(trans: str):
     if trans == 'TRANS3':
-        return (
-            Expr.symbol('CL') / Expr.symbol('V'),
-            Expr.symbol('Q') / Expr.symbol('V'),
-            Expr.symbol('Q') / (Expr.symbol('VSS') - Expr.symbol('V')),
-        )
+        cl, q, v, vss = _symbols('CL', 'Q', 'V', 'VSS')
+        return (cl / v, q / v, q / (vss - v))
     elif trans == 'TRANS4':
-        return (
-            Expr.symbol('CL') / Expr.symbol('V1'),
-            Expr.symbol('Q') / Expr.symbol('V1'),
-            Expr.symbol('Q') / Expr.symbol('V2'),
-        )
+        cl, q, v1, v2 = _symbols('CL', 'Q', 'V1', 'V2')
+        return (cl / v1, q / v1, q / v2)
     elif trans == 'TRANS5':
+        alpha, beta, aob, k, k21 = _symbols('ALPHA', 'BETA', 'AOB', 'K', 'K21')
         return (
-            Expr.symbol('ALPHA') * Expr.symbol('BETA') / Expr.symbol('K21'),
-            Expr.symbol('ALPHA') + Expr.symbol('BETA') - Expr.symbol('K21') - Expr.symbol('K'),
-            (Expr.symbol('AOB') * Expr.symbol('BETA') + Expr.symbol('ALPHA'))
-            / (Expr.symbol('AOB') + 1),
+            alpha * beta / k21,
+            alpha + beta - k21 - k,
+            (aob * beta + alpha) / (aob + 1),
         )
     elif trans == 'TRANS6':
-        return (
-            Expr.symbol('ALPHA') * Expr.symbol('BETA') / Expr.symbol('K21'),
-            Expr.symbol('ALPHA') + Expr.symbol('BETA') - Expr.symbol('K21') - Expr.symbol('K'),
-            Expr.symbol('K21'),
-        )
+        alpha, beta, k, k21 = _symbols('ALPHA', 'BETA', 'K', 'K21')
+        return (alpha * beta / k21, alpha + beta - k21 - k, k21)
     else:
-        return (Expr.symbol('K'), Expr.symbol('K12'), Expr.symbol('K21'))
+        return _symbols('K', 'K12', 'K21')
 
 
+@lru_cache(maxsize=None)
 def _advan4_trans(trans: str):
     if trans == 'TRANS3':
-        return (
-            Expr.symbol('CL') / Expr.symbol('V'),
-            Expr.symbol('Q') / Expr.symbol('V'),
-            Expr.symbol('Q') / (Expr.symbol('VSS') - Expr.symbol('V')),
-            Expr.symbol('KA'),
-        )
+        cl, q, v, vss, ka = _symbols('CL', 'Q', 'V', 'VSS', 'KA')
+        return (cl / v, q / v, q / (vss - v), ka)
     elif trans == 'TRANS4':
-        return (
-            Expr.symbol('CL') / Expr.symbol('V2'),
-            Expr.symbol('Q') / Expr.symbol('V2'),
-            Expr.symbol('Q') / Expr.symbol('V3'),
-            Expr.symbol('KA'),
-        )
+        cl, q, v2, v3, ka = _symbols('CL', 'Q', 'V2', 'V3', 'KA')
+        return (cl / v2, q / v2, q / v3, ka)
     elif trans == 'TRANS5':
+        alpha, beta, aob, k, k32, ka = _symbols('ALPHA', 'BETA', 'AOB', 'K', 'K32', 'KA')
         return (
-            Expr.symbol('ALPHA') * Expr.symbol('BETA') / Expr.symbol('K32'),
-            Expr.symbol('ALPHA') + Expr.symbol('BETA') - Expr.symbol('K32') - Expr.symbol('K'),
-            (Expr.symbol('AOB') * Expr.symbol('BETA') + Expr.symbol('ALPHA'))
-            / (Expr.symbol('AOB') + 1),
-            Expr.symbol('KA'),
+            alpha * beta / k32,
+            alpha + beta - k32 - k,
+            (aob * beta + alpha) / (aob + 1),
+            ka,
         )
     elif trans == 'TRANS6':
-        return (
-            Expr.symbol('ALPHA') * Expr.symbol('BETA') / Expr.symbol('K32'),
-            Expr.symbol('ALPHA') + Expr.symbol('BETA') - Expr.symbol('K32') - Expr.symbol('K'),
-            Expr.symbol('K32'),
-            Expr.symbol('KA'),
-        )
+        alpha, beta, k, k32, ka = _symbols('ALPHA', 'BETA', 'K', 'K32', 'KA')
+        return (alpha * beta / k32, alpha + beta - k32 - k, k32, ka)
     else:
-        return (Expr.symbol('K'), Expr.symbol('K23'), Expr.symbol('K32'), Expr.symbol('KA'))
+        return _symbols('K', 'K23', 'K32', 'KA')
 
 
+@lru_cache(maxsize=None)
 def _advan11_trans(trans: str):
     if trans == 'TRANS4':
-        return (
-            Expr.symbol('CL') / Expr.symbol('V1'),
-            Expr.symbol('Q2') / Expr.symbol('V1'),
-            Expr.symbol('Q2') / Expr.symbol('V2'),
-            Expr.symbol('Q3') / Expr.symbol('V1'),
-            Expr.symbol('Q3') / Expr.symbol('V3'),
-        )
+        cl, q2, q3, v1, v2, v3 = _symbols('CL', 'Q2', 'Q3', 'V1', 'V2', 'V3')
+        return (cl / v1, q2 / v1, q2 / v2, q3 / v1, q3 / v3)
     elif trans == 'TRANS6':
+        alpha, beta, gamma, k, k13, k21, k31 = _symbols(
+            'ALPHA', 'BETA', 'GAMMA', 'K', 'K13', 'K21', 'K31'
+        )
         return (
-            Expr.symbol('ALPHA')
-            * Expr.symbol('BETA')
-            * Expr.symbol('GAMMA')
-            / (Expr.symbol('K21') * Expr.symbol('K31')),
-            Expr.symbol('ALPHA')
-            + Expr.symbol('BETA')
-            + Expr.symbol('GAMMA')
-            - Expr.symbol('K')
-            - Expr.symbol('K13')
-            - Expr.symbol('K21')
-            - Expr.symbol('K31'),
-            Expr.symbol('K21'),
+            alpha * beta * gamma / (k21 * k31),
+            alpha + beta + gamma - k - k13 - k21 - k31,
+            k21,
             (
-                Expr.symbol('ALPHA') * Expr.symbol('BETA')
-                + Expr.symbol('ALPHA') * Expr.symbol('GAMMA')
-                + Expr.symbol('BETA') * Expr.symbol('GAMMA')
-                + Expr.symbol('K31') * Expr.symbol('K31')
-                - Expr.symbol('K31')
-                * (Expr.symbol('ALPHA') + Expr.symbol('BETA') + Expr.symbol('GAMMA'))
-                - Expr.symbol('K') * Expr.symbol('K21')
+                alpha * beta
+                + alpha * gamma
+                + beta * gamma
+                + k31 * k31
+                - k31 * (alpha + beta + gamma)
+                - k * k21
             )
-            / (Expr.symbol('K21') - Expr.symbol('K31')),
-            Expr.symbol('K31'),
+            / (k21 - k31),
+            k31,
         )
     else:
-        return (
-            Expr.symbol('K'),
-            Expr.symbol('K12'),
-            Expr.symbol('K21'),
-            Expr.symbol('K13'),
-            Expr.symbol('K31'),
-        )
+        return _symbols('K', 'K12', 'K21', 'K13', 'K31')
 
 
+@lru_cache(maxsize=None)
 def _advan12_trans(trans: str):
     if trans == 'TRANS4':
-        return (
-            Expr.symbol('CL') / Expr.symbol('V2'),
-            Expr.symbol('Q3') / Expr.symbol('V2'),
-            Expr.symbol('Q3') / Expr.symbol('V3'),
-            Expr.symbol('Q4') / Expr.symbol('V2'),
-            Expr.symbol('Q4') / Expr.symbol('V4'),
-            Expr.symbol('KA'),
-        )
+        cl, q3, q4, v2, v3, v4, ka = _symbols('CL', 'Q3', 'Q4', 'V2', 'V3', 'V4', 'KA')
+        return (cl / v2, q3 / v2, q3 / v3, q4 / v2, q4 / v4, ka)
     elif trans == 'TRANS6':
+        alpha, beta, gamma, k, k24, k32, k42, ka = _symbols(
+            'ALPHA', 'BETA', 'GAMMA', 'K', 'K24', 'K32', 'K42', 'KA'
+        )
         return (
-            Expr.symbol('ALPHA')
-            * Expr.symbol('BETA')
-            * Expr.symbol('GAMMA')
-            / (Expr.symbol('K32') * Expr.symbol('K42')),
-            Expr.symbol('ALPHA')
-            + Expr.symbol('BETA')
-            + Expr.symbol('GAMMA')
-            - Expr.symbol('K')
-            - Expr.symbol('K24')
-            - Expr.symbol('K32')
-            - Expr.symbol('K42'),
-            Expr.symbol('K32'),
+            alpha * beta * gamma / (k32 * k42),
+            alpha + beta + gamma - k - k24 - k32 - k42,
+            k32,
             (
-                Expr.symbol('ALPHA') * Expr.symbol('BETA')
-                + Expr.symbol('ALPHA') * Expr.symbol('GAMMA')
-                + Expr.symbol('BETA') * Expr.symbol('GAMMA')
-                + Expr.symbol('K42') * Expr.symbol('K42')
-                - Expr.symbol('K42')
-                * (Expr.symbol('ALPHA') + Expr.symbol('BETA') + Expr.symbol('GAMMA'))
-                - Expr.symbol('K') * Expr.symbol('K32')
+                alpha * beta
+                + alpha * gamma
+                + beta * gamma
+                + k42 * k42
+                - k42 * (alpha + beta + gamma)
+                - k * k32
             )
-            / (Expr.symbol('K32') - Expr.symbol('K42')),
-            Expr.symbol('K42'),
-            Expr.symbol('KA'),
+            / (k32 - k42),
+            k42,
+            ka,
         )
     else:
-        return (
-            Expr.symbol('K'),
-            Expr.symbol('K23'),
-            Expr.symbol('K32'),
-            Expr.symbol('K24'),
-            Expr.symbol('K42'),
-            Expr.symbol('KA'),
-        )
+        return _symbols('K', 'K23', 'K32', 'K24', 'K42', 'KA')
 
 
 def dosing(di: DataInfo, dataset, dose_comp: int):
     # Only check doses
+    # NOTE: The dataset is only inspected if there is a RATE, CMT or admid
+    # column. Otherwise all doses are boluses and filtering can be skipped.
+    # Only these columns are kept so that the dose rows are not copied
+    # for every column in the dataset.
     if dataset is not None:
-        amtcol = di.typeix["dose"][0].name
-        dataset = dataset[dataset[amtcol] != 0]
+        columns = [name for name in ('RATE', 'CMT') if _has_column(di, name)]
+        if 'admid' in di.types:
+            columns.append(di.typeix["admid"][0].name)
+        if columns:
+            amtcol = di.typeix["dose"][0].name
+            dataset = dataset.loc[dataset[amtcol] != 0, columns]
 
     cmt_loop = False
     admid_name = None
@@ -620,11 +565,11 @@ def dosing(di: DataInfo, dataset, dose_comp: int):
         return_dose = True
     elif 'admid' in di.types:
         admid_name = di.typeix["admid"][0].name
-        if 'CMT' in di.names and not di['CMT'].drop:
+        if _has_column(di, 'CMT'):
             if len(dataset['CMT']) == 1:
                 warnings.warn("CMT column present with only one value")
             cmt_loop = True
-    elif 'CMT' in di.names and not di['CMT'].drop:
+    elif _has_column(di, 'CMT'):
         if len(dataset['CMT']) == 1:
             warnings.warn("CMT column present with only one value")
             return_dose = True
@@ -677,20 +622,27 @@ def dosing(di: DataInfo, dataset, dose_comp: int):
     return doses
 
 
+def _has_column(di: DataInfo, name: str) -> bool:
+    return name in di.names and not di[name].drop
+
+
 def _dosing(di, dataset, dose_comp):
     amt = Expr.symbol('AMT')
-    if 'RATE' not in di.names or di['RATE'].drop:
+    if not _has_column(di, 'RATE'):
         return Bolus(amt)
 
     df = dataset
 
     if df is None:
         return Bolus(amt)
-    elif (df['RATE'] == 0).all():
+
+    # NOTE: Only the few distinct rates need to be compared
+    rates = df['RATE'].unique()
+    if (rates == 0).all():
         return Bolus(amt)
-    elif (df['RATE'] == -1).any():
+    elif (rates == -1).any():
         return Infusion(amt, rate=Expr.symbol(f'R{dose_comp}'))
-    elif (df['RATE'] == -2).any():
+    elif (rates == -2).any():
         return Infusion(amt, duration=Expr.symbol(f'D{dose_comp}'))
     else:
         return Infusion(amt, rate=Expr.symbol('RATE'))
@@ -707,21 +659,25 @@ def find_dose(doses, comp_number, admid=1):
     return comp_doses
 
 
-def _get_alag(control_stream: NMTranControlStream, n: int):
+def _get_pk_assigned_names(control_stream: NMTranControlStream) -> frozenset[str]:
+    """Get names of all symbols assigned in $PK"""
+    pkrec = control_stream.get_records('PK')[0]
+    return frozenset(s.symbol.name for s in pkrec.statements if isinstance(s, Assignment))
+
+
+def _get_alag(pk_names: frozenset[str], n: int):
     """Check if ALAGn is defined in model and return it else return 0"""
     alag = f'ALAG{n}'
-    pkrec = control_stream.get_records('PK')[0]
-    if pkrec.statements.find_assignment(alag):
+    if alag in pk_names:
         return Expr.symbol(alag)
     else:
         return Expr.integer(0)
 
 
-def _get_bioavailability(control_stream: NMTranControlStream, n: int):
+def _get_bioavailability(pk_names: frozenset[str], n: int):
     """Check if Fn is defined in model and return it else return 0"""
     fn = f'F{n}'
-    pkrec = control_stream.get_records('PK')[0]
-    if pkrec.statements.find_assignment(fn):
+    if fn in pk_names:
         return Expr.symbol(fn)
     else:
         return Expr.integer(1)
@@ -735,8 +691,9 @@ def parse_model_record(control_stream):
     defcentral: Optional[tuple[str, int]] = None
     defdepot: Optional[tuple[str, int]] = None
     deffirst_dose: Optional[tuple[str, int]] = None
-    comp_names = []
+    comp_map = {}
     for i, (name, opts) in enumerate(modrec.compartments(), 1):
+        opts = frozenset(opts)
         if 'DEFOBSERVATION' in opts:
             defobs = (name, i)
         if 'DEFDOSE' in opts:
@@ -747,13 +704,11 @@ def parse_model_record(control_stream):
             defdepot = (name, i)
         if deffirst_dose is None and 'NODOSE' not in opts:
             deffirst_dose = (name, i)
-        comp_names.append(name)
-
-    comp_map = {name: i for i, name in enumerate(comp_names, 1)}
+        comp_map[name] = i
 
     if defobs is None:
         if defcentral is None:
-            defobs = (comp_names[0], 1)
+            defobs = (next(iter(comp_map)), 1)
         else:
             defobs = defcentral
 
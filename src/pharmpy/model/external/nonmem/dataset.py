@@ -98,6 +98,22 @@ def _convert_data_item(x, null_value, missing_data_token):
     return converted
 
 
+def _convert_data_column(column, null_value, missing_data_token):
+    # NOTE: Columns typically have few distinct items so convert each distinct
+    # item once and broadcast back to the rows
+    if len(column) == 0:
+        return column.apply(_convert_data_item, args=(null_value, missing_data_token))
+    codes, uniques = pd.factorize(column, use_na_sentinel=False)
+    converted = np.array(
+        [
+            _convert_data_item(x if isinstance(x, str) else None, null_value, missing_data_token)
+            for x in uniques
+        ],
+        dtype=np.float64,
+    )
+    return pd.Series(converted[codes], index=column.index, name=column.name)
+
+
 def _make_ids_unique(df, columns):
     """Check if id numbers are reused and make renumber. If not simply pass through the dataset."""
     if 'ID' in df.columns:
@@ -212,8 +228,8 @@ def _filter_ignore_accept(df, ignore, accept, null_value, missing_data_token):
             # for further information.
             # Using a name with spaces since this cannot collide with other NONMEM names
             magic_colname = 'a a'
-            df[magic_colname] = df[column].apply(
-                _convert_data_item, args=(str(null_value), missing_data_token)
+            df[magic_colname] = _convert_data_column(
+                df[column], str(null_value), missing_data_token
             )
             expression = f'`{magic_colname}` {operator} {expr}'
             if ignore:
@@ -224,6 +240,40 @@ def _filter_ignore_accept(df, ignore, accept, null_value, missing_data_token):
     return df
 
 
+def _read_data_table(contents: str):
+    kwargs = {'na_filter': False, 'header': None, 'quoting': 3, 'dtype': object, 'index_col': False}
+    # NOTE: The C parser is much faster than the python parser needed for the
+    # mixed separators. Use it for datasets separated only by spaces, where short
+    # rows are padded in the same way, or only by commas as long as all rows have
+    # the same number of items.
+    if '\t' not in contents:
+        df = None
+        if ',' not in contents:
+            try:
+                df = pd.read_table(StringIO(contents), sep=r'\s+', engine='c', **kwargs)
+            except pd.errors.ParserError:
+                pass
+        elif ' ' not in contents:
+            try:
+                df = pd.read_table(StringIO(contents), sep=',', engine='c', **kwargs)
+            except pd.errors.ParserError:
+                pass
+            else:
+                if contents.count(',') != len(df) * (len(df.columns) - 1):
+                    df = None
+        if df is not None:
+            return df
+
+    df = pd.read_table(
+        StringIO(contents),
+        sep=r' *, *| *[\t] *| +',
+        engine='python',
+        **kwargs,
+    )
+    assert isinstance(df, pd.DataFrame)
+    return df
+
+
 def read_nonmem_dataset(
     path_or_io,
     raw=False,
@@ -268,17 +318,7 @@ def read_nonmem_dataset(
         raise KeyError('Column names are not unique')
 
     file_io = NMTRANDataIO(path_or_io, ignore_character)
-    df = pd.read_table(
-        file_io,
-        sep=r' *, *| *[\t] *| +',
-        na_filter=False,
-        header=None,
-        engine='python',
-        quoting=3,
-        dtype=object,
-        index_col=False,
-    )
-    assert isinstance(df, pd.DataFrame)
+    df = _read_data_table(file_io.getvalue())
 
     diff_cols = len(df.columns) - len(colnames)
     if diff_cols > 0:
@@ -305,9 +345,7 @@ def read_nonmem_dataset(
             x for x in parse_columns if x not in ['TIME', 'DATE', 'DAT1', 'DAT2', 'DAT3']
         ]
     for column in parse_columns:
-        df[column] = df[column].apply(
-            _convert_data_item, args=(str(null_value), missing_data_token)
-        )
+        df[column] = _convert_data_column(df[column], str(null_value), missing_data_token)
     df = _make_ids_unique(df, parse_columns)
 
     if not raw:
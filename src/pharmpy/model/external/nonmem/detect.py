@@ -1,5 +1,7 @@
 import re
 
+_PRO_REGEX = re.compile(r'^\s*\$PRO', re.MULTILINE)
+
 
 def detect_model(src):
     """Check if src represents a NONMEM control stream
@@ -7,5 +9,8 @@ def detect_model(src):
     """
     if not isinstance(src, str):
         return False
-    is_control_stream = re.search(r'^\s*\$PRO', src, re.MULTILINE)
+    # NOTE: A plain substring test quickly rejects sources that cannot match
+    if '$PRO' not in src:
+        return None
+    is_control_stream = _PRO_REGEX.search(src)
     return is_control_stream
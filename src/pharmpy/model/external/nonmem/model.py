@@ -44,6 +44,8 @@ from .update import (
     update_thetas,
 )
 
+_ETA_NAME_REGEX = re.compile(r'ETA[_(]([0-9]+)\)*')
+
 
 @dataclass(frozen=True)
 class NONMEMModelInternals(ModelInternals):
@@ -60,6 +62,7 @@ class NONMEMModelInternals(ModelInternals):
     old_dependent_variables: frozenmapping[Expr, int]
     compartment_map: Optional[dict[str, int]]
     name_map: dict[str, str]
+    source_state: Optional[tuple] = None
 
 
 def convert_model(model):
@@ -67,21 +70,15 @@ def convert_model(model):
     if isinstance(model, Model):
         return model
 
-    code = '$PROBLEM\n'
-    code += (
-        '$INPUT '
-        + ' '.join(
-            f'{column.name}=DROP' if column.drop else column.name for column in model.datainfo
-        )
-        + '\n'
-    )
-    code += '$DATA file.csv IGNORE=@\n'
+    input_columns = [
+        f'{column.name}=DROP' if column.drop else column.name for column in model.datainfo
+    ]
+    lines = ['$PROBLEM', '$INPUT ' + ' '.join(input_columns), '$DATA file.csv IGNORE=@']
     if model.statements.ode_system is None:
-        code += '$PRED\nY=X\n'
+        lines += ['$PRED', 'Y=X']
     else:
-        code += '$SUBROUTINES ADVAN1 TRANS2\n'
-        code += '$PK\nY=X\n'
-        code += '$ERROR\nA=B\n'
+        lines += ['$SUBROUTINES ADVAN1 TRANS2', '$PK', 'Y=X', '$ERROR', 'A=B']
+    code = '\n'.join(lines) + '\n'
     nm_model = parse_model(
         code, dataset=model.dataset, missing_data_token=model.datainfo.missing_data_token
     )
@@ -136,6 +133,15 @@ class Model(BaseModel):
         path - path to modelfile
         nofiles - Set to not write any files (i.e. dataset, phi input etc)
         """
+        # NOTE: Models are immutable and unchanged attributes are shared by replace
+        # so if all attributes are the same objects as after the last update the
+        # control stream is already up to date
+        source_state = self.internals.source_state
+        if source_state is not None and all(
+            a is b for a, b in zip(source_state, self._source_state())
+        ):
+            return self
+
         model = self
 
         if not model.random_variables.etas:
@@ -172,7 +178,7 @@ class Model(BaseModel):
         i = 1
         for dist in model._random_variables.etas:
             for name in dist.names:
-                nonmem_pattern = re.match(r'ETA[_(]([0-9]+)\)*', name)
+                nonmem_pattern = _ETA_NAME_REGEX.match(name)
                 if not nonmem_pattern:
                     rv_trans[name] = f'ETA({i})'
                 elif nonmem_pattern.group(1) != str(i):
@@ -250,7 +256,22 @@ class Model(BaseModel):
                 )
             )
 
-        return model
+        return model.replace(internals=model.internals.replace(source_state=model._source_state()))
+
+    def _source_state(self):
+        return (
+            self._name,
+            self._description,
+            self._parameters,
+            self._random_variables,
+            self._statements,
+            self._dataset,
+            self._datainfo,
+            self._dependent_variables,
+            self._observation_transformation,
+            self._execution_steps,
+            self._initial_individual_estimates,
+        )
 
     def write_files(self, path=None, force=False):
         if path is not None:
@@ -368,8 +389,9 @@ def parse_model(
 
     parameters, rvs, name_map = parse_parameters(control_stream, statements, di)
 
-    subs_map = {Expr.symbol(key): Expr.symbol(val) for key, val in name_map.items()}
-    statements = statements.subs(subs_map)
+    subs_map = {Expr.symbol(key): Expr.symbol(val) for key, val in name_map.items() if key != val}
+    if subs_map:
+        statements = statements.subs(subs_map)
 
     # FIXME: Handle by creation of new model object
     if not rvs.validate_parameters(parameters.inits):
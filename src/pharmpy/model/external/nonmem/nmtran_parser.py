@@ -90,20 +90,30 @@ class NMTranControlStream:
             self.records = tuple(records)
         self._active_problem = 0
         self.abbreviated = Abbreviated(self)
+        # NOTE: The records are never changed after creation so the index of
+        # records by name for each problem can be built once on first use
+        self._records_by_name = {}
 
     def get_records(self, name, problem_no=0):
         """Return a list of all records of a certain type in the current $PROBLEM"""
         # $SIZES is not problem-specific
         if name == 'SIZES':
             return [rec for rec in self.records if rec.name == 'SIZES']
+        index = self._records_by_name.get(problem_no)
+        if index is None:
+            index = self._index_records(problem_no)
+            self._records_by_name[problem_no] = index
+        return list(index.get(name, ()))
+
+    def _index_records(self, problem_no):
         current_problem = -1
-        found = []
+        index = {}
         for record in self.records:
             if record.name == 'PROBLEM':
                 current_problem += 1
-            if current_problem == problem_no and record.name == name:
-                found.append(record)
-        return found
+            if current_problem == problem_no:
+                index.setdefault(record.name, []).append(record)
+        return index
 
     def _get_first_record(self, name):
         return next(iter(self.get_records(name)), None)
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import warnings
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -251,9 +252,8 @@ def parse_statements(
             cm, link, comp_map = comp
             statements += [cm, link]
             if des:
-                rec_model = control_stream.get_records('MODEL')[0]
-                comps = [c for c, _ in rec_model.compartments()]
-                for i, c in enumerate(comps, 1):
+                # NOTE: comp_map already holds the $MODEL compartments in order
+                for c, i in comp_map.items():
                     trans_amounts[Expr.symbol(f"A({i})")] = Expr.function(f'A_{c}', 't')
                     trans_amounts[Expr.symbol(f"A_0({i})")] = Expr.function(f'A_{c}', 0)
             else:
@@ -403,9 +403,40 @@ def extract_verbatim_derivatives(cs, random_variables):
     return verbatim_derivatives
 
 
+_PROTECTED_ESTIMATION_OPTIONS = frozenset(
+    (
+        'EONLY',
+        'INTERACTION',
+        'INTER',
+        'LAPLACE',
+        'LAPLACIAN',
+        'MAX',
+        'MAXEVAL',
+        'MAXEVALS',
+        'METHOD',
+        'METH',
+        'ISAMPLE',
+        'NITER',
+        'AUTO',
+        'PRINT',
+        'MSFO',
+        'ETASAMPLES',
+    )
+)
+
+
+def _get_option(option_values, name):
+    # NOTE: Same matching as OptionRecord.get_option, i.e. the first option
+    # having the same first three characters
+    return option_values.get(name[:3])
+
+
 def parse_execution_steps(control_stream, random_variables) -> ExecutionSteps:
     steps = []
     records = control_stream.get_records('ESTIMATION')
+    if not records:
+        # NOTE: Nothing below is needed if there are no estimation steps
+        return ExecutionSteps.create(steps)
     covrec = control_stream.get_records('COVARIANCE')
     design = control_stream.get_records('DESIGN', 1)
     solver, tol, atol = parse_solver(control_stream)
@@ -450,7 +481,14 @@ def parse_execution_steps(control_stream, random_variables) -> ExecutionSteps:
     derivatives = tuple(etaderiv_names + epsilonderivs_names + verbatim_derivatives)
 
     for record in records:
-        value = record.get_option('METHOD')
+        # NOTE: All option lookups are done on the options extracted once per record
+        all_options = record.all_options
+        option_keys = {option.key for option in all_options}
+        option_values = {}
+        for option in all_options:
+            option_values.setdefault(option.key[:3], option.value)
+
+        value = _get_option(option_values, 'METHOD')
         if value is None or value == '0' or value == 'ZERO':
             name = 'fo'
         elif value == '1' or value == 'CONDITIONAL' or value == 'COND':
@@ -467,66 +505,46 @@ def parse_execution_steps(control_stream, random_variables) -> ExecutionSteps:
         auto = None
         keep_every_nth_iter = None
 
-        if record.has_option('INTERACTION') or record.has_option('INTER'):
+        if 'INTERACTION' in option_keys or 'INTER' in option_keys:
             interaction = True
-        maxeval_opt = record.get_option('MAXEVAL') if not None else record.get_option('MAXEVALS')
-        if maxeval_opt is None:
-            maxeval_opt = record.get_option('MAX')
+        # NOTE: MAXEVAL, MAXEVALS and MAX share the same three character prefix
+        maxeval_opt = _get_option(option_values, 'MAXEVAL')
         if maxeval_opt is not None:
             if (name.upper() == 'FO' or name.upper() == 'FOCE') and int(maxeval_opt) == 0:
                 evaluation = True
             else:
                 maximum_evaluations = int(maxeval_opt)
-        eval_opt = record.get_option('EONLY')
+        eval_opt = _get_option(option_values, 'EONLY')
         if eval_opt is not None and int(eval_opt) == 1:
             evaluation = True
         if covrec:
             parameter_uncertainty_method = 'SANDWICH'
         elif design:
             parameter_uncertainty_method = 'EFIM'
-        if record.has_option('LAPLACIAN') or record.has_option('LAPLACE'):
+        if 'LAPLACIAN' in option_keys or 'LAPLACE' in option_keys:
             laplace = True
-        if record.has_option('ISAMPLE'):
-            isample = int(record.get_option('ISAMPLE'))
-        if record.has_option('NITER'):
-            niter = int(record.get_option('NITER'))
-        if record.has_option('AUTO'):
-            auto_opt = record.get_option('AUTO')
+        if 'ISAMPLE' in option_keys:
+            isample = int(_get_option(option_values, 'ISAMPLE'))
+        if 'NITER' in option_keys:
+            niter = int(_get_option(option_values, 'NITER'))
+        if 'AUTO' in option_keys:
+            auto_opt = _get_option(option_values, 'AUTO')
             if auto_opt is not None and int(auto_opt) in [0, 1]:
                 auto = bool(auto_opt)
             else:
                 raise ValueError('Currently only AUTO=0 and AUTO=1 is supported')
-        if record.has_option('PRINT'):
-            keep_every_nth_iter = int(record.get_option('PRINT'))
-        if record.has_option('ETASAMPLES'):
-            individual_eta_samples = bool(int(record.get_option('ETASAMPLES')))
+        if 'PRINT' in option_keys:
+            keep_every_nth_iter = int(_get_option(option_values, 'PRINT'))
+        if 'ETASAMPLES' in option_keys:
+            individual_eta_samples = bool(int(_get_option(option_values, 'ETASAMPLES')))
         else:
             individual_eta_samples = False
 
-        protected_names = [
-            name.upper(),
-            'EONLY',
-            'INTERACTION',
-            'INTER',
-            'LAPLACE',
-            'LAPLACIAN',
-            'MAX',
-            'MAXEVAL',
-            'MAXEVALS',
-            'METHOD',
-            'METH',
-            'ISAMPLE',
-            'NITER',
-            'AUTO',
-            'PRINT',
-            'MSFO',
-            'ETASAMPLES',
-        ]
-
+        method_name = name.upper()
         tool_options = {
             option.key: option.value
-            for option in record.all_options
-            if option.key not in protected_names
+            for option in all_options
+            if option.key not in _PROTECTED_ESTIMATION_OPTIONS and option.key != method_name
         }
 
         try:
@@ -626,9 +644,8 @@ def parse_dataset_path(control_stream, basepath) -> Optional[Path]:
     return path_absolute(path)
 
 
-def _synonym(key, value):
-    """Return a tuple reserved name and synonym"""
-    _reserved_column_names = [
+_RESERVED_COLUMN_NAMES = frozenset(
+    (
         'ID',
         'L1',
         'L2',
@@ -652,10 +669,15 @@ def _synonym(key, value):
         'PCMT',
         'CALL',
         'CONT',
-    ]
-    if key in _reserved_column_names:
+    )
+)
+
+
+def _synonym(key, value):
+    """Return a tuple reserved name and synonym"""
+    if key in _RESERVED_COLUMN_NAMES:
         return (key, value)
-    elif value in _reserved_column_names:
+    elif value in _RESERVED_COLUMN_NAMES:
         return (value, key)
     else:
         raise DatasetError(
@@ -671,7 +693,16 @@ def parse_column_info(control_stream):
     of replacements for reserved names (aka synonyms).
     Anonymous columns, i.e. DROP or SKIP alone, will be given unique names _DROP1, ...
     """
-    input_records = control_stream.get_records("INPUT")
+    # NOTE: Records are immutable and shared between versions of a control
+    # stream so the parsing is cached on the $INPUT records themselves
+    colnames, drop, synonym_replacement, given_names = _parse_input_records(
+        tuple(control_stream.get_records("INPUT"))
+    )
+    return list(colnames), list(drop), dict(synonym_replacement), list(given_names)
+
+
+@lru_cache(maxsize=64)
+def _parse_input_records(input_records):
     colnames = []
     drop = []
     synonym_replacement = {}
@@ -705,13 +736,12 @@ def parse_column_info(control_stream):
                     colnames.append(key)
                     given_names.append(key)
                     drop.append(False)
-    return colnames, drop, synonym_replacement, given_names
+    return tuple(colnames), tuple(drop), synonym_replacement, tuple(given_names)
 
 
 def parse_datainfo(control_stream, path) -> DataInfo:
     resolved_dataset_path = parse_dataset_path(control_stream, path)
     di_nonmem = create_nonmem_datainfo(control_stream, resolved_dataset_path)
-    (colnames, drop, replacements, _) = parse_column_info(control_stream)
 
     if resolved_dataset_path is None:
         return di_nonmem
@@ -747,40 +777,41 @@ def validate_datainfo(di_pharmpy, di_nonmem):
     return di_pharmpy
 
 
+_DATE_COLUMN_NAMES = frozenset(('DATE', 'DAT1', 'DAT2', 'DAT3'))
+
+
 def create_nonmem_datainfo(control_stream, resolved_dataset_path):
     (colnames, drop, replacements, _) = parse_column_info(control_stream)
 
     column_info = []
     have_pk = control_stream.get_pk_record()
+    # NOTE: Lookups that do not depend on the current column are done once
+    dv_name = replacements.get('DV', None)
+    time_name = replacements.get('TIME', None)
+    amt_name = replacements.get('AMT', None)
+    time_datatype = 'float64' if _DATE_COLUMN_NAMES.isdisjoint(colnames) else 'nmtran-time'
+    mdv_type = 'mdv' if 'EVID' in colnames else 'event'
     for colname, coldrop in zip(colnames, drop):
-        if coldrop and colname not in ['DATE', 'DAT1', 'DAT2', 'DAT3']:
+        if coldrop and colname not in _DATE_COLUMN_NAMES:
             info = ColumnInfo.create(colname, drop=coldrop, datatype='str')
         elif colname == 'ID' or colname == 'L1':
             info = ColumnInfo.create(
                 colname, drop=coldrop, datatype='int32', type='id', scale='nominal'
             )
-        elif colname == 'DV' or colname == replacements.get('DV', None):
+        elif colname == 'DV' or colname == dv_name:
             info = ColumnInfo.create(colname, drop=coldrop, type='dv')
-        elif colname == 'TIME' or colname == replacements.get('TIME', None):
-            if not set(colnames).isdisjoint({'DATE', 'DAT1', 'DAT2', 'DAT3'}):
-                datatype = 'nmtran-time'
-            else:
-                datatype = 'float64'
+        elif colname == 'TIME' or colname == time_name:
             info = ColumnInfo.create(
-                colname, drop=coldrop, type='idv', scale='ratio', datatype=datatype
+                colname, drop=coldrop, type='idv', scale='ratio', datatype=time_datatype
             )
-        elif colname in ['DATE', 'DAT1', 'DAT2', 'DAT3']:
+        elif colname in _DATE_COLUMN_NAMES:
             # Always DROP in mod-file, but actually always used
             info = ColumnInfo.create(colname, drop=False, scale='interval', datatype='nmtran-date')
         elif colname == 'EVID' and have_pk:
             info = ColumnInfo.create(colname, drop=coldrop, type='event', scale='nominal')
         elif colname == 'MDV' and have_pk:
-            if 'EVID' in colnames:
-                tp = 'mdv'
-            else:
-                tp = 'event'
             info = ColumnInfo.create(
-                colname, drop=coldrop, type=tp, scale='nominal', datatype='int32'
+                colname, drop=coldrop, type=mdv_type, scale='nominal', datatype='int32'
             )
         elif colname == 'II' and have_pk:
             info = ColumnInfo.create(colname, drop=coldrop, type='ii', scale='ratio')
@@ -788,7 +819,7 @@ def create_nonmem_datainfo(control_stream, resolved_dataset_path):
             info = ColumnInfo.create(colname, drop=coldrop, type='ss', scale='nominal')
         elif colname == 'ADDL' and have_pk:
             info = ColumnInfo.create(colname, drop=coldrop, type='additional', scale='ordinal')
-        elif (colname == 'AMT' or colname == replacements.get('AMT', None)) and have_pk:
+        elif (colname == 'AMT' or colname == amt_name) and have_pk:
             info = ColumnInfo.create(colname, drop=coldrop, type='dose', scale='ratio')
         elif colname == 'CMT' and have_pk:
             info = ColumnInfo.create(colname, drop=coldrop, type='compartment', scale='nominal')
@@ -809,6 +840,9 @@ def create_nonmem_datainfo(control_stream, resolved_dataset_path):
 
 
 def replace_synonym_in_filters(filters, replacements):
+    if not replacements:
+        # NOTE: Most datasets have no synonyms so the filters can be used as is
+        return [str(f) for f in filters]
     result = []
     for f in filters:
         col = f.leaf('COLUMN').value
@@ -886,11 +920,14 @@ def filter_observations(df, di):
             except IndexError:
                 raise ValueError("Unable to find dosing records in the dataset")
 
-    df_obs = df.astype({label: 'float'}).query(f'{label} == 0')
-    have_obs = set(df_obs['ID'].unique())
-    all_ids = set(df['ID'].unique())
-    ids_to_remove = all_ids - have_obs
-    return df[~df['ID'].isin(ids_to_remove)]
+    # NOTE: Only the label column is converted and compared instead of
+    # converting and querying a copy of the whole dataset
+    ids = df['ID']
+    have_obs = ids[df[label].astype('float') == 0].unique()
+    if len(have_obs) == ids.nunique(dropna=False):
+        # All individuals have observations
+        return df
+    return df[ids.isin(have_obs)]
 
 
 def parse_table_columns(control_stream, netas, problem_no=0):
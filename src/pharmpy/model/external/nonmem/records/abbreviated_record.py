@@ -7,6 +7,8 @@ from itertools import islice
 
 from .record import Record
 
+_INDEX_REGEX = re.compile(r'\((\w+)\)')
+
 
 def _is_quoted_with(q: str, s: str):
     return s.startswith(q) and s.endswith(q)
@@ -33,4 +35,4 @@ class AbbreviatedRecord(Record):
         return d
 
     def translate_to_pharmpy_names(self):
-        return {value: re.sub(r'\((\w+)\)', r'_\1', key) for key, value in self.replaceopt.items()}
+        return {value: _INDEX_REGEX.sub(r'_\1', key) for key, value in self.replaceopt.items()}
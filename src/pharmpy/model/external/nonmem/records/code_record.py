@@ -517,8 +517,8 @@ class CodeRecord(Record):
             self._index = []
         else:
             self._index = index
-        if statements is not None:
-            self._statements = statements
+        # NOTE: None until the statements have been parsed or given
+        self._statements = statements
         super().__init__(name, raw_name, content)
 
     @property
@@ -529,9 +529,8 @@ class CodeRecord(Record):
         return statements
 
     def update_statements(self, new: Sequence[Statement], rvs=None, trans=None):
-        try:
-            old = self._statements
-        except AttributeError:
+        old = self._statements
+        if old is None:
             old = self.statements
         if new == old:
             return self
@@ -2,8 +2,26 @@
 The NONMEM $MODEL record
 """
 
+from functools import lru_cache
+
 from .option_record import OptionRecord
 
+_COMPARTMENT_OPTIONS = (
+    'INITIALOFF',
+    'NOOFF',
+    'NODOSE',
+    'EQUILIBRIUM',
+    'EXCLUDE',
+    'DEFOBSERVATION',
+    'DEFDOSE',
+)
+
+
+@lru_cache(maxsize=256)
+def _match_compartment_option(opt):
+    # NOTE: The same few compartment names and options are matched over and over
+    return OptionRecord.match_option(_COMPARTMENT_OPTIONS, opt)
+
 
 class ModelRecord(OptionRecord):
     @property
@@ -39,20 +57,11 @@ class ModelRecord(OptionRecord):
                 yield f'COMP{i}', []
             return
 
-        all_options = [
-            'INITIALOFF',
-            'NOOFF',
-            'NODOSE',
-            'EQUILIBRIUM',
-            'EXCLUDE',
-            'DEFOBSERVATION',
-            'DEFDOSE',
-        ]
         for n, opts in enumerate(self.get_option_lists('COMPARTMENT')):
             name = f'COMP{n + 1}'
             options = []
             for opt in opts:
-                match = OptionRecord.match_option(all_options, opt)
+                match = _match_compartment_option(opt)
                 if match:
                     options.append(match)
                 else:
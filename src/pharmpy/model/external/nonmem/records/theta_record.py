@@ -12,12 +12,14 @@ MAX_UPPER_BOUND = 1000000
 MIN_LOWER_BOUND = -1000000
 INF = float("inf")
 
+_COMMENT_NAME_REGEX = re.compile(r';\s*([a-zA-Z_]\w*)')
+
 
 def lower_token(theta):
     # Get raw lower bound for a theta subtree
     # Either a float, None for non-existing or 'neginf' for -INF
-    if theta.find('low'):
-        low = theta.subtree('low')
+    low = theta.find('low')
+    if isinstance(low, AttrTree):
         if low.find('NEG_INF'):
             lower = 'neginf'
         else:
@@ -30,8 +32,8 @@ def lower_token(theta):
 def upper_token(theta):
     # Get raw upper bound for a theta subtree
     # Either a float, None for non-existing or 'inf' for INF
-    if theta.find('up'):
-        up = theta.subtree('up')
+    up = theta.find('up')
+    if isinstance(up, AttrTree):
         if up.find('POS_INF'):
             upper = 'inf'
         else:
@@ -155,8 +157,9 @@ def add_parentheses(theta):
 class ThetaRecord(Record):
     def _multiple(self, theta: AttrTree) -> int:
         """Return the multiple (xn) of a theta or 1 if no multiple"""
-        if theta.find('n'):
-            return cast(int, eval_token(theta.subtree('n').leaf('INT')))
+        n = theta.find('n')
+        if isinstance(n, AttrTree):
+            return cast(int, eval_token(n.leaf('INT')))
         else:
             return 1
 
@@ -264,7 +267,7 @@ class ThetaRecord(Record):
                     names.extend([None] * n)
                 n = self._multiple(node)
             if intheta and node.rule == 'COMMENT':
-                m = re.search(r';\s*([a-zA-Z_]\w*)', str(node))
+                m = _COMMENT_NAME_REGEX.search(str(node))
                 if m:
                     names.append(m.group(1))
                 else:
@@ -298,7 +301,7 @@ class ThetaRecord(Record):
             init = theta.subtree('init')
             if eval_token(init.leaf('NUMERIC')) != new_init:
                 init = init.replace_first(AttrToken('NUMERIC', str(new_init)))
-            theta = theta.replace_first(init)
+                theta = theta.replace_first(init)
             fix = bool(theta.find('FIX'))
             if fix != param.fix:
                 if param.fix:
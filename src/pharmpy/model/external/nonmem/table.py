@@ -133,10 +133,10 @@ class NONMEMTableFile:
                 return table
 
     def write(self, path):
+        # NOTE: The tables are formatted in full before writing them in one call
+        content = ''.join(f'TABLE NO.     1\n{table.content}' for table in self.tables)
         with open(path, 'w') as df:
-            for table in self.tables:
-                print('TABLE NO.     1', file=df)
-                print(table.content, file=df, end='')
+            df.write(content)
 
 
 class NONMEMTable:
@@ -172,8 +172,8 @@ class NONMEMTable:
 
     @property
     def content(self):
-        df = self._df.copy(deep=True)
-        df.reset_index(inplace=True)
+        # NOTE: reset_index already returns a new frame so no extra copy is needed
+        df = self._df.reset_index()
         df.insert(loc=0, column='SUBJECT_NO', value=np.arange(len(df)) + 1)
         fmt = '%13d%13d' + '%13.5E' * (len(df.columns) - 2)
 
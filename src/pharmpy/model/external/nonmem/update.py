@@ -86,10 +86,11 @@ def reorder_diff(diff, kept_names):
 
 
 def update_thetas(model: Model, control_stream, old: Parameters, new: Parameters):
-    new_thetas = [p for p in new if p.symbol not in model.random_variables.free_symbols]
-    old_thetas = [
-        p for p in old if p.symbol not in model.internals.old_random_variables.free_symbols
-    ]
+    # NOTE: The free symbols are computed once instead of for every parameter
+    new_rv_symbols = model.random_variables.free_symbols
+    old_rv_symbols = model.internals.old_random_variables.free_symbols
+    new_thetas = [p for p in new if p.symbol not in new_rv_symbols]
+    old_thetas = [p for p in old if p.symbol not in old_rv_symbols]
 
     diff_thetas = diff(old_thetas, new_thetas)
     theta_records = control_stream.get_records('THETA')
@@ -2199,7 +2200,8 @@ def update_sizes(control_stream, model: Model):
     n_compartments = get_needed_PC(model)
     sizes = sizes.set_PC(n_compartments)
 
-    thetas = [p for p in model.parameters if p.symbol not in model.random_variables.free_symbols]
+    rv_symbols = model.random_variables.free_symbols
+    thetas = [p for p in model.parameters if p.symbol not in rv_symbols]
     sizes = sizes.set_LTH(len(thetas))
 
     isamplemax = get_needed_ISAMPLEMAX(model)
@@ -2237,6 +2239,7 @@ def update_input(control_stream, model: Model):
     """Update $INPUT"""
     input_records = control_stream.get_records("INPUT")
     _, drop, _, colnames = parse_column_info(control_stream)
+    datainfo = model.datainfo
     keep = []
     i = 0
     for child in input_records[0].root.children:
@@ -2244,12 +2247,11 @@ def update_input(control_stream, model: Model):
             keep.append(child)
             continue
 
-        if (colnames[i] is not None and (colnames[i] != model.datainfo[i].name)) or (
-            not drop[i] and (model.datainfo[i].drop or model.datainfo[i].datatype == 'nmtran-date')
-        ):
-            dropped = model.datainfo[i].drop or model.datainfo[i].datatype == 'nmtran-date'
+        col = datainfo[i]
+        dropped = col.drop or col.datatype == 'nmtran-date'
+        if (colnames[i] is not None and (colnames[i] != col.name)) or (not drop[i] and dropped):
             anonymous = colnames[i] is None
-            key = 'DROP' if anonymous and dropped else model.datainfo[i].name
+            key = 'DROP' if anonymous and dropped else col.name
             value = 'DROP' if not anonymous and dropped else None
             new = input_records[0]._create_option(key, value)
             keep.append(new)
@@ -2258,7 +2260,7 @@ def update_input(control_stream, model: Model):
 
         i += 1
 
-        if i >= len(model.datainfo):
+        if i >= len(datainfo):
             last_child = input_records[0].root.children[-1]
             if last_child.rule == 'NEWLINE':
                 keep.append(last_child)
@@ -2267,7 +2269,7 @@ def update_input(control_stream, model: Model):
     newroot = AttrTree(input_records[0].root.rule, tuple(keep))
     new_input = input_records[0].replace(root=newroot)
 
-    for ci in model.datainfo[len(colnames) :]:
+    for ci in datainfo[len(colnames) :]:
         new_input = new_input.append_option(ci.name, 'DROP' if ci.drop else None)
     control_stream = control_stream.replace_records([input_records[0]], [new_input])
     return control_stream
@@ -2310,12 +2312,13 @@ def update_initial_individual_estimates(model: Model, path, nofiles=False):
     assert estimates is not None
     estimates = estimates.copy()
     eta_names = model.random_variables.etas.names
+    eta_set = set(eta_names)
     columns = set(estimates.columns)
-    diff = columns - set(eta_names)
-    if columns < set(eta_names):
+    diff = columns - eta_set
+    if columns < eta_set:
         raise ValueError(
             f'Cannot set initial estimate for random variable not in the model:'
-            f' {set(eta_names) - columns}'
+            f' {eta_set - columns}'
         )
     # If not setting all etas automatically set remaining to 0 for all individuals
     if len(diff) > 0:
@@ -2357,38 +2360,52 @@ def update_initial_individual_estimates(model: Model, path, nofiles=False):
 
 
 def _sort_eta_columns(df: pd.DataFrame, rv_names):
+    # NOTE: The columns are most often already in the order of the etas
+    if list(df.columns) == list(rv_names):
+        return df
     return df.reindex(rv_names, axis=1)
 
 
 def abbr_translation(model: Model, rv_trans):
-    abbr_pharmpy = model.internals.control_stream.abbreviated.translate_to_pharmpy_names()
-    abbr_replace = model.internals.control_stream.abbreviated.replace
+    abbreviated = model.internals.control_stream.abbreviated
+    abbr_replace = abbreviated.replace
     model, abbr_trans = update_abbr_record(model, rv_trans)
-    abbr_recs = {
-        Expr.symbol(abbr_pharmpy[value]): Expr.symbol(key)
-        for key, value in abbr_replace.items()
-        if value in abbr_pharmpy.keys()
-    }
-    abbr_trans.update(abbr_recs)
+    # NOTE: Most models have no $ABBR REPLACE so only translate if needed
+    if abbr_replace:
+        abbr_pharmpy = abbreviated.translate_to_pharmpy_names()
+        abbr_recs = {
+            Expr.symbol(abbr_pharmpy[value]): Expr.symbol(key)
+            for key, value in abbr_replace.items()
+            if value in abbr_pharmpy
+        }
+        abbr_trans.update(abbr_recs)
     return model, abbr_trans
 
 
 def create_name_map(model):
     trans = {}
-    thetas = [p for p in model._parameters if p.symbol not in model.random_variables.free_symbols]
+    rv_symbols = model.random_variables.free_symbols
+    thetas = [p for p in model._parameters if p.symbol not in rv_symbols]
     for i, theta in enumerate(thetas):
         trans[theta.name] = f'THETA({i + 1})'
 
     def add_rv_params(rvs, param_name):
-        cov = rvs.covariance_matrix
-        for row in range(0, cov.rows):
-            for col in range(0, row + 1):
-                if cov[row, col] != 0:
-                    nonmem_name = f'{param_name}({row + 1},{col + 1})'
-                    name = cov[row, col].name
-                    if name not in trans:
-                        # Do not add more than once to handle IOV SAME
-                        trans[name] = nonmem_name
+        # NOTE: The covariance matrix is block diagonal so the blocks are
+        # read from each distribution instead of building the full matrix
+        offset = 1
+        for dist in rvs:
+            n = len(dist)
+            variance = dist.variance
+            for row in range(n):
+                for col in range(row + 1):
+                    elem = variance[row, col] if n > 1 else variance
+                    if elem != 0:
+                        nonmem_name = f'{param_name}({offset + row},{offset + col})'
+                        name = elem.name
+                        if name not in trans:
+                            # Do not add more than once to handle IOV SAME
+                            trans[name] = nonmem_name
+            offset += n
 
         i = 1
         for dist in rvs:
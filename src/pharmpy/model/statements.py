@@ -118,6 +118,8 @@ class Assignment(Statement):
         """
         symbol = self.symbol.subs(substitutions)
         expression = self.expression.subs(substitutions)
+        if symbol == self.symbol and expression == self.expression:
+            return self
         expression = expression.piecewise_fold()
         return Assignment(symbol, expression)
 
@@ -560,6 +562,10 @@ def to_compartmental_system(names, eqs: Sequence[sympy.Eq]) -> CompartmentalSyst
 
     neweqs = list(eqs)  # Remaining flows
 
+    # NOTE: The expanded terms of each original equation are looked up once per
+    # candidate flow term, so expand every right hand side only once
+    expanded_terms = [(eq.lhs.args[0], set(sympy.Add.make_args(eq.rhs.expand()))) for eq in eqs]
+
     for eq in eqs:
         rhs = eq.rhs
         assert isinstance(rhs, sympy.Expr)
@@ -575,19 +581,19 @@ def to_compartmental_system(names, eqs: Sequence[sympy.Eq]) -> CompartmentalSyst
                     # to determine flow
                     if _is_positive(term):
                         for second_comp in concentrations.intersection(free_images(term)):
-                            for eq_2 in eqs:
-                                if eq_2.lhs.args[0].name == second_comp.name:
+                            for func_2, terms_2 in expanded_terms:
+                                if func_2.name == second_comp.name:
                                     # If this is False, then input to compartment is of second order
-                                    if -term in sympy.Add.make_args(eq_2.rhs.expand()):
+                                    if -term in terms_2:
                                         from_comp = compartments[names[Expr(second_comp)]]
                                         to_comp = compartments[names[Expr(eq.lhs.args[0])]]
                 else:
                     # Find matching term to determine if flow is between
                     # compartments or not
                     if _is_positive(term):
-                        for eq_2 in eqs:
-                            if -term in sympy.Add.make_args(eq_2.rhs.expand()):
-                                from_comp = compartments[names[Expr(eq_2.lhs.args[0])]]
+                        for func_2, terms_2 in expanded_terms:
+                            if -term in terms_2:
+                                from_comp = compartments[names[Expr(func_2)]]
                                 to_comp = compartments[names[Expr(eq.lhs.args[0])]]
 
                 if from_comp is not None and to_comp is not None:
@@ -612,14 +618,18 @@ def to_compartmental_system(names, eqs: Sequence[sympy.Eq]) -> CompartmentalSyst
                             )
     for eq in neweqs:
         if eq.rhs != 0:
-            i = sympy.Integer(0)
-            o = sympy.Integer(0)
+            # NOTE: Collect the terms and build each sum once instead of
+            # accumulating, which would rebuild the Add for every term
+            inputs = []
+            outputs = []
             for term in sympy.Add.make_args(eq.rhs):
                 assert isinstance(term, sympy.Expr)
                 if _is_positive(term):
-                    i = i + term  # pyright: ignore
+                    inputs.append(term)
                 else:
-                    o = o + term  # pyright: ignore
+                    outputs.append(term)
+            i = sympy.Add(*inputs)
+            o = sympy.Add(*outputs)
             comp_func = eq.lhs.args[0]
             from_comp = compartments[names[Expr(comp_func)]]
             if o != 0:
@@ -2190,6 +2200,8 @@ class Statements(Sequence, Immutable):
                 V = VC
                 S₁ = VC
         """
+        # NOTE: Convert the keys and values once instead of once per statement
+        substitutions = {Expr(key): Expr(value) for key, value in substitutions.items()}
         return Statements(s.subs(substitutions) for s in self)
 
     def _lookup_last_assignment(
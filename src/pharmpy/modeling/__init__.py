@@ -1,252 +1,263 @@
-from .allometry import add_allometry
-from .basic_models import create_basic_pk_model
-from .blq import transform_blq
-from .common import (
-    bump_model_number,
-    convert_model,
-    create_config_template,
-    filter_dataset,
-    get_config_path,
-    get_model_code,
-    get_model_covariates,
-    load_example_model,
-    print_model_code,
-    print_model_symbols,
-    read_model,
-    read_model_from_string,
-    remove_unused_parameters_and_rvs,
-    rename_symbols,
-    set_description,
-    set_name,
-    write_model,
-)
-from .compartments import get_bioavailability, get_lag_times
-from .covariate_effect import (
-    add_covariate_effect,
-    get_covariate_effects,
-    has_covariate_effect,
-    remove_covariate_effect,
-)
-from .data import (
-    add_admid,
-    add_cmt,
-    add_time_after_dose,
-    bin_observations,
-    check_dataset,
-    deidentify_data,
-    drop_columns,
-    drop_dropped_columns,
-    expand_additional_doses,
-    get_admid,
-    get_baselines,
-    get_cmt,
-    get_concentration_parameters_from_data,
-    get_covariate_baselines,
-    get_doseid,
-    get_doses,
-    get_evid,
-    get_ids,
-    get_mdv,
-    get_number_of_individuals,
-    get_number_of_observations,
-    get_number_of_observations_per_individual,
-    get_observations,
-    list_time_varying_covariates,
-    load_dataset,
-    read_dataset_from_datainfo,
-    remove_loq_data,
-    set_covariates,
-    set_dataset,
-    set_dvid,
-    set_lloq_data,
-    set_reference_values,
-    translate_nmtran_time,
-    undrop_columns,
-    unload_dataset,
-)
-from .error import (
-    has_additive_error_model,
-    has_combined_error_model,
-    has_proportional_error_model,
-    has_weighted_error_model,
-    remove_error_model,
-    set_additive_error_model,
-    set_combined_error_model,
-    set_dtbs_error_model,
-    set_iiv_on_ruv,
-    set_power_on_ruv,
-    set_proportional_error_model,
-    set_time_varying_error_model,
-    set_weighted_error_model,
-    use_thetas_for_error_stdev,
-)
-from .estimation import calculate_parameters_from_ucp, calculate_ucp_scale
-from .estimation_steps import (
-    add_derivative,
-    add_estimation_step,
-    add_parameter_uncertainty_step,
-    add_predictions,
-    add_residuals,
-    append_estimation_step_options,
-    is_simulation_model,
-    remove_derivative,
-    remove_estimation_step,
-    remove_parameter_uncertainty_step,
-    remove_predictions,
-    remove_residuals,
-    set_estimation_step,
-    set_evaluation_step,
-    set_simulation,
-)
-from .evaluation import (
-    evaluate_epsilon_gradient,
-    evaluate_eta_gradient,
-    evaluate_expression,
-    evaluate_individual_prediction,
-    evaluate_population_prediction,
-    evaluate_weighted_residuals,
-)
-from .expressions import (
-    calculate_epsilon_gradient_expression,
-    calculate_eta_gradient_expression,
-    cleanup_model,
-    create_symbol,
-    get_dv_symbol,
-    get_individual_parameters,
-    get_individual_prediction_expression,
-    get_mu_connected_to_parameter,
-    get_observation_expression,
-    get_parameter_rv,
-    get_pd_parameters,
-    get_pk_parameters,
-    get_population_prediction_expression,
-    get_rv_parameters,
-    greekify_model,
-    has_mu_reference,
-    has_random_effect,
-    is_linearized,
-    is_real,
-    make_declarative,
-    mu_reference_model,
-    simplify_expression,
-)
-from .iterators import omit_data, resample_data
-from .math import (
-    calculate_corr_from_cov,
-    calculate_corr_from_prec,
-    calculate_cov_from_corrse,
-    calculate_cov_from_prec,
-    calculate_prec_from_corrse,
-    calculate_prec_from_cov,
-    calculate_se_from_cov,
-    calculate_se_from_prec,
-)
-from .metabolite import add_metabolite, has_presystemic_metabolite
-from .odes import (
-    add_bioavailability,
-    add_individual_parameter,
-    add_lag_time,
-    add_peripheral_compartment,
-    display_odes,
-    find_clearance_parameters,
-    find_volume_parameters,
-    get_central_volume_and_clearance,
-    get_initial_conditions,
-    get_number_of_peripheral_compartments,
-    get_number_of_transit_compartments,
-    get_zero_order_inputs,
-    has_first_order_absorption,
-    has_first_order_elimination,
-    has_instantaneous_absorption,
-    has_linear_odes,
-    has_linear_odes_with_real_eigenvalues,
-    has_michaelis_menten_elimination,
-    has_mixed_mm_fo_elimination,
-    has_odes,
-    has_seq_zo_fo_absorption,
-    has_zero_order_absorption,
-    has_zero_order_elimination,
-    remove_bioavailability,
-    remove_lag_time,
-    remove_peripheral_compartment,
-    set_first_order_absorption,
-    set_first_order_elimination,
-    set_initial_condition,
-    set_instantaneous_absorption,
-    set_michaelis_menten_elimination,
-    set_mixed_mm_fo_elimination,
-    set_ode_solver,
-    set_peripheral_compartments,
-    set_seq_zo_fo_absorption,
-    set_transit_compartments,
-    set_zero_order_absorption,
-    set_zero_order_elimination,
-    set_zero_order_input,
-    solve_ode_system,
-)
-from .parameter_sampling import (
-    create_rng,
-    sample_individual_estimates,
-    sample_parameters_from_covariance_matrix,
-    sample_parameters_uniformly,
-)
-from .parameter_variability import (
-    add_iiv,
-    add_iov,
-    add_pd_iiv,
-    add_pk_iiv,
-    create_joint_distribution,
-    remove_iiv,
-    remove_iov,
-    split_joint_distribution,
-    transform_etas_boxcox,
-    transform_etas_john_draper,
-    transform_etas_tdist,
-    update_initial_individual_estimates,
-)
-from .parameters import (
-    add_population_parameter,
-    fix_or_unfix_parameters,
-    fix_parameters,
-    fix_parameters_to,
-    get_omegas,
-    get_sigmas,
-    get_thetas,
-    replace_fixed_thetas,
-    set_initial_estimates,
-    set_lower_bounds,
-    set_upper_bounds,
-    unconstrain_parameters,
-    unfix_parameters,
-    unfix_parameters_to,
-)
-from .pd import add_effect_compartment, add_indirect_effect, set_baseline_effect, set_direct_effect
-from .plots import (
-    plot_abs_cwres_vs_ipred,
-    plot_cwres_vs_idv,
-    plot_dv_vs_ipred,
-    plot_dv_vs_pred,
-    plot_eta_distributions,
-    plot_individual_predictions,
-    plot_iofv_vs_iofv,
-    plot_transformed_eta_distributions,
-    plot_vpc,
-)
-from .random_variables import replace_non_random_rvs
-from .results import (
-    calculate_aic,
-    calculate_bic,
-    calculate_eta_shrinkage,
-    calculate_individual_parameter_statistics,
-    calculate_individual_shrinkage,
-    calculate_pk_parameters_statistics,
-    check_high_correlations,
-    check_parameters_near_bounds,
-)
-from .tmdd import set_tmdd
-from .units import get_unit_of
+from typing import TYPE_CHECKING
+
+# NOTE: Imported directly since the submodule has the same name as the function.
+# Importing the submodule lazily would otherwise shadow the function.
 from .write_csv import write_csv
 
+if TYPE_CHECKING:
+    from .allometry import add_allometry
+    from .basic_models import create_basic_pk_model
+    from .blq import transform_blq
+    from .common import (
+        bump_model_number,
+        convert_model,
+        create_config_template,
+        filter_dataset,
+        get_config_path,
+        get_model_code,
+        get_model_covariates,
+        load_example_model,
+        print_model_code,
+        print_model_symbols,
+        read_model,
+        read_model_from_string,
+        remove_unused_parameters_and_rvs,
+        rename_symbols,
+        set_description,
+        set_name,
+        write_model,
+    )
+    from .compartments import get_bioavailability, get_lag_times
+    from .covariate_effect import (
+        add_covariate_effect,
+        get_covariate_effects,
+        has_covariate_effect,
+        remove_covariate_effect,
+    )
+    from .data import (
+        add_admid,
+        add_cmt,
+        add_time_after_dose,
+        bin_observations,
+        check_dataset,
+        deidentify_data,
+        drop_columns,
+        drop_dropped_columns,
+        expand_additional_doses,
+        get_admid,
+        get_baselines,
+        get_cmt,
+        get_concentration_parameters_from_data,
+        get_covariate_baselines,
+        get_doseid,
+        get_doses,
+        get_evid,
+        get_ids,
+        get_mdv,
+        get_number_of_individuals,
+        get_number_of_observations,
+        get_number_of_observations_per_individual,
+        get_observations,
+        list_time_varying_covariates,
+        load_dataset,
+        read_dataset_from_datainfo,
+        remove_loq_data,
+        set_covariates,
+        set_dataset,
+        set_dvid,
+        set_lloq_data,
+        set_reference_values,
+        translate_nmtran_time,
+        undrop_columns,
+        unload_dataset,
+    )
+    from .error import (
+        has_additive_error_model,
+        has_combined_error_model,
+        has_proportional_error_model,
+        has_weighted_error_model,
+        remove_error_model,
+        set_additive_error_model,
+        set_combined_error_model,
+        set_dtbs_error_model,
+        set_iiv_on_ruv,
+        set_power_on_ruv,
+        set_proportional_error_model,
+        set_time_varying_error_model,
+        set_weighted_error_model,
+        use_thetas_for_error_stdev,
+    )
+    from .estimation import calculate_parameters_from_ucp, calculate_ucp_scale
+    from .estimation_steps import (
+        add_derivative,
+        add_estimation_step,
+        add_parameter_uncertainty_step,
+        add_predictions,
+        add_residuals,
+        append_estimation_step_options,
+        is_simulation_model,
+        remove_derivative,
+        remove_estimation_step,
+        remove_parameter_uncertainty_step,
+        remove_predictions,
+        remove_residuals,
+        set_estimation_step,
+        set_evaluation_step,
+        set_simulation,
+    )
+    from .evaluation import (
+        evaluate_epsilon_gradient,
+        evaluate_eta_gradient,
+        evaluate_expression,
+        evaluate_individual_prediction,
+        evaluate_population_prediction,
+        evaluate_weighted_residuals,
+    )
+    from .expressions import (
+        calculate_epsilon_gradient_expression,
+        calculate_eta_gradient_expression,
+        cleanup_model,
+        create_symbol,
+        get_dv_symbol,
+        get_individual_parameters,
+        get_individual_prediction_expression,
+        get_mu_connected_to_parameter,
+        get_observation_expression,
+        get_parameter_rv,
+        get_pd_parameters,
+        get_pk_parameters,
+        get_population_prediction_expression,
+        get_rv_parameters,
+        greekify_model,
+        has_mu_reference,
+        has_random_effect,
+        is_linearized,
+        is_real,
+        make_declarative,
+        mu_reference_model,
+        simplify_expression,
+    )
+    from .iterators import omit_data, resample_data
+    from .math import (
+        calculate_corr_from_cov,
+        calculate_corr_from_prec,
+        calculate_cov_from_corrse,
+        calculate_cov_from_prec,
+        calculate_prec_from_corrse,
+        calculate_prec_from_cov,
+        calculate_se_from_cov,
+        calculate_se_from_prec,
+    )
+    from .metabolite import add_metabolite, has_presystemic_metabolite
+    from .odes import (
+        add_bioavailability,
+        add_individual_parameter,
+        add_lag_time,
+        add_peripheral_compartment,
+        display_odes,
+        find_clearance_parameters,
+        find_volume_parameters,
+        get_central_volume_and_clearance,
+        get_initial_conditions,
+        get_number_of_peripheral_compartments,
+        get_number_of_transit_compartments,
+        get_zero_order_inputs,
+        has_first_order_absorption,
+        has_first_order_elimination,
+        has_instantaneous_absorption,
+        has_linear_odes,
+        has_linear_odes_with_real_eigenvalues,
+        has_michaelis_menten_elimination,
+        has_mixed_mm_fo_elimination,
+        has_odes,
+        has_seq_zo_fo_absorption,
+        has_zero_order_absorption,
+        has_zero_order_elimination,
+        remove_bioavailability,
+        remove_lag_time,
+        remove_peripheral_compartment,
+        set_first_order_absorption,
+        set_first_order_elimination,
+        set_initial_condition,
+        set_instantaneous_absorption,
+        set_michaelis_menten_elimination,
+        set_mixed_mm_fo_elimination,
+        set_ode_solver,
+        set_peripheral_compartments,
+        set_seq_zo_fo_absorption,
+        set_transit_compartments,
+        set_zero_order_absorption,
+        set_zero_order_elimination,
+        set_zero_order_input,
+        solve_ode_system,
+    )
+    from .parameter_sampling import (
+        create_rng,
+        sample_individual_estimates,
+        sample_parameters_from_covariance_matrix,
+        sample_parameters_uniformly,
+    )
+    from .parameter_variability import (
+        add_iiv,
+        add_iov,
+        add_pd_iiv,
+        add_pk_iiv,
+        create_joint_distribution,
+        remove_iiv,
+        remove_iov,
+        split_joint_distribution,
+        transform_etas_boxcox,
+        transform_etas_john_draper,
+        transform_etas_tdist,
+        update_initial_individual_estimates,
+    )
+    from .parameters import (
+        add_population_parameter,
+        fix_or_unfix_parameters,
+        fix_parameters,
+        fix_parameters_to,
+        get_omegas,
+        get_sigmas,
+        get_thetas,
+        replace_fixed_thetas,
+        set_initial_estimates,
+        set_lower_bounds,
+        set_upper_bounds,
+        unconstrain_parameters,
+        unfix_parameters,
+        unfix_parameters_to,
+    )
+    from .pd import (
+        add_effect_compartment,
+        add_indirect_effect,
+        set_baseline_effect,
+        set_direct_effect,
+    )
+    from .plots import (
+        plot_abs_cwres_vs_ipred,
+        plot_cwres_vs_idv,
+        plot_dv_vs_ipred,
+        plot_dv_vs_pred,
+        plot_eta_distributions,
+        plot_individual_predictions,
+        plot_iofv_vs_iofv,
+        plot_transformed_eta_distributions,
+        plot_vpc,
+    )
+    from .random_variables import replace_non_random_rvs
+    from .results import (
+        calculate_aic,
+        calculate_bic,
+        calculate_eta_shrinkage,
+        calculate_individual_parameter_statistics,
+        calculate_individual_shrinkage,
+        calculate_pk_parameters_statistics,
+        check_high_correlations,
+        check_parameters_near_bounds,
+    )
+    from .tmdd import set_tmdd
+    from .units import get_unit_of
+
 # Must be set directly, otherwise errors about unused imports
 __all__ = [
     'add_admid',
@@ -477,3 +488,291 @@ __all__ = [
     'unload_dataset',
     'plot_vpc',
 ]
+
+
+_submodule_attributes = {
+    '.allometry': ('add_allometry',),
+    '.basic_models': ('create_basic_pk_model',),
+    '.blq': ('transform_blq',),
+    '.common': (
+        'bump_model_number',
+        'convert_model',
+        'create_config_template',
+        'filter_dataset',
+        'get_config_path',
+        'get_model_code',
+        'get_model_covariates',
+        'load_example_model',
+        'print_model_code',
+        'print_model_symbols',
+        'read_model',
+        'read_model_from_string',
+        'remove_unused_parameters_and_rvs',
+        'rename_symbols',
+        'set_description',
+        'set_name',
+        'write_model',
+    ),
+    '.compartments': (
+        'get_bioavailability',
+        'get_lag_times',
+    ),
+    '.covariate_effect': (
+        'add_covariate_effect',
+        'get_covariate_effects',
+        'has_covariate_effect',
+        'remove_covariate_effect',
+    ),
+    '.data': (
+        'add_admid',
+        'add_cmt',
+        'add_time_after_dose',
+        'bin_observations',
+        'check_dataset',
+        'deidentify_data',
+        'drop_columns',
+        'drop_dropped_columns',
+        'expand_additional_doses',
+        'get_admid',
+        'get_baselines',
+        'get_cmt',
+        'get_concentration_parameters_from_data',
+        'get_covariate_baselines',
+        'get_doseid',
+        'get_doses',
+        'get_evid',
+        'get_ids',
+        'get_mdv',
+        'get_number_of_individuals',
+        'get_number_of_observations',
+        'get_number_of_observations_per_individual',
+        'get_observations',
+        'list_time_varying_covariates',
+        'load_dataset',
+        'read_dataset_from_datainfo',
+        'remove_loq_data',
+        'set_covariates',
+        'set_dataset',
+        'set_dvid',
+        'set_lloq_data',
+        'set_reference_values',
+        'translate_nmtran_time',
+        'undrop_columns',
+        'unload_dataset',
+    ),
+    '.error': (
+        'has_additive_error_model',
+        'has_combined_error_model',
+        'has_proportional_error_model',
+        'has_weighted_error_model',
+        'remove_error_model',
+        'set_additive_error_model',
+        'set_combined_error_model',
+        'set_dtbs_error_model',
+        'set_iiv_on_ruv',
+        'set_power_on_ruv',
+        'set_proportional_error_model',
+        'set_time_varying_error_model',
+        'set_weighted_error_model',
+        'use_thetas_for_error_stdev',
+    ),
+    '.estimation': (
+        'calculate_parameters_from_ucp',
+        'calculate_ucp_scale',
+    ),
+    '.estimation_steps': (
+        'add_derivative',
+        'add_estimation_step',
+        'add_parameter_uncertainty_step',
+        'add_predictions',
+        'add_residuals',
+        'append_estimation_step_options',
+        'is_simulation_model',
+        'remove_derivative',
+        'remove_estimation_step',
+        'remove_parameter_uncertainty_step',
+        'remove_predictions',
+        'remove_residuals',
+        'set_estimation_step',
+        'set_evaluation_step',
+        'set_simulation',
+    ),
+    '.evaluation': (
+        'evaluate_epsilon_gradient',
+        'evaluate_eta_gradient',
+        'evaluate_expression',
+        'evaluate_individual_prediction',
+        'evaluate_population_prediction',
+        'evaluate_weighted_residuals',
+    ),
+    '.expressions': (
+        'calculate_epsilon_gradient_expression',
+        'calculate_eta_gradient_expression',
+        'cleanup_model',
+        'create_symbol',
+        'get_dv_symbol',
+        'get_individual_parameters',
+        'get_individual_prediction_expression',
+        'get_mu_connected_to_parameter',
+        'get_observation_expression',
+        'get_parameter_rv',
+        'get_pd_parameters',
+        'get_pk_parameters',
+        'get_population_prediction_expression',
+        'get_rv_parameters',
+        'greekify_model',
+        'has_mu_reference',
+        'has_random_effect',
+        'is_linearized',
+        'is_real',
+        'make_declarative',
+        'mu_reference_model',
+        'simplify_expression',
+    ),
+    '.iterators': (
+        'omit_data',
+        'resample_data',
+    ),
+    '.math': (
+        'calculate_corr_from_cov',
+        'calculate_corr_from_prec',
+        'calculate_cov_from_corrse',
+        'calculate_cov_from_prec',
+        'calculate_prec_from_corrse',
+        'calculate_prec_from_cov',
+        'calculate_se_from_cov',
+        'calculate_se_from_prec',
+    ),
+    '.metabolite': (
+        'add_metabolite',
+        'has_presystemic_metabolite',
+    ),
+    '.odes': (
+        'add_bioavailability',
+        'add_individual_parameter',
+        'add_lag_time',
+        'add_peripheral_compartment',
+        'display_odes',
+        'find_clearance_parameters',
+        'find_volume_parameters',
+        'get_central_volume_and_clearance',
+        'get_initial_conditions',
+        'get_number_of_peripheral_compartments',
+        'get_number_of_transit_compartments',
+        'get_zero_order_inputs',
+        'has_first_order_absorption',
+        'has_first_order_elimination',
+        'has_instantaneous_absorption',
+        'has_linear_odes',
+        'has_linear_odes_with_real_eigenvalues',
+        'has_michaelis_menten_elimination',
+        'has_mixed_mm_fo_elimination',
+        'has_odes',
+        'has_seq_zo_fo_absorption',
+        'has_zero_order_absorption',
+        'has_zero_order_elimination',
+        'remove_bioavailability',
+        'remove_lag_time',
+        'remove_peripheral_compartment',
+        'set_first_order_absorption',
+        'set_first_order_elimination',
+        'set_initial_condition',
+        'set_instantaneous_absorption',
+        'set_michaelis_menten_elimination',
+        'set_mixed_mm_fo_elimination',
+        'set_ode_solver',
+        'set_peripheral_compartments',
+        'set_seq_zo_fo_absorption',
+        'set_transit_compartments',
+        'set_zero_order_absorption',
+        'set_zero_order_elimination',
+        'set_zero_order_input',
+        'solve_ode_system',
+    ),
+    '.parameter_sampling': (
+        'create_rng',
+        'sample_individual_estimates',
+        'sample_parameters_from_covariance_matrix',
+        'sample_parameters_uniformly',
+    ),
+    '.parameter_variability': (
+        'add_iiv',
+        'add_iov',
+        'add_pd_iiv',
+        'add_pk_iiv',
+        'create_joint_distribution',
+        'remove_iiv',
+        'remove_iov',
+        'split_joint_distribution',
+        'transform_etas_boxcox',
+        'transform_etas_john_draper',
+        'transform_etas_tdist',
+        'update_initial_individual_estimates',
+    ),
+    '.parameters': (
+        'add_population_parameter',
+        'fix_or_unfix_parameters',
+        'fix_parameters',
+        'fix_parameters_to',
+        'get_omegas',
+        'get_sigmas',
+        'get_thetas',
+        'replace_fixed_thetas',
+        'set_initial_estimates',
+        'set_lower_bounds',
+        'set_upper_bounds',
+        'unconstrain_parameters',
+        'unfix_parameters',
+        'unfix_parameters_to',
+    ),
+    '.pd': (
+        'add_effect_compartment',
+        'add_indirect_effect',
+        'set_baseline_effect',
+        'set_direct_effect',
+    ),
+    '.plots': (
+        'plot_abs_cwres_vs_ipred',
+        'plot_cwres_vs_idv',
+        'plot_dv_vs_ipred',
+        'plot_dv_vs_pred',
+        'plot_eta_distributions',
+        'plot_individual_predictions',
+        'plot_iofv_vs_iofv',
+        'plot_transformed_eta_distributions',
+        'plot_vpc',
+    ),
+    '.random_variables': ('replace_non_random_rvs',),
+    '.results': (
+        'calculate_aic',
+        'calculate_bic',
+        'calculate_eta_shrinkage',
+        'calculate_individual_parameter_statistics',
+        'calculate_individual_shrinkage',
+        'calculate_pk_parameters_statistics',
+        'check_high_correlations',
+        'check_parameters_near_bounds',
+    ),
+    '.tmdd': ('set_tmdd',),
+    '.units': ('get_unit_of',),
+}
+
+_module_name_index = {key: module for module, keys in _submodule_attributes.items() for key in keys}
+
+
+def __getattr__(key):
+    # NOTE: Submodules are imported on first use to keep the import of
+    # pharmpy.modeling fast
+    if key not in _module_name_index:
+        raise AttributeError(f"module '{__name__}' has no attribute '{key}'")
+
+    import importlib
+
+    module = importlib.import_module(_module_name_index[key], __name__)
+    value = getattr(module, key)
+    globals()[key] = value
+    return value
+
+
+def __dir__():
+    return __all__
@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Optional, Union
 
 from pharmpy.basic import Expr, TExpr, TSymbol
-from pharmpy.model import Assignment, Model, Parameter, Parameters
+from pharmpy.model import Assignment, Model, Parameter, Parameters, Statements
 
 from .expressions import _create_symbol
 from .odes import find_clearance_parameters, find_volume_parameters
 
 
+@lru_cache(maxsize=128, typed=True)
+def _parse_expr(x: Union[TSymbol, TExpr]) -> Expr:
+    # NOTE: The same variable and reference value are typically used in many calls
+    return Expr(x)
+
+
 def add_allometry(
     model: Model,
     allometric_variable: Optional[TSymbol] = None,
@@ -94,8 +101,8 @@ def add_allometry(
                 "No allometric variable could be found. Try setting the allometric_variable argument"
             )
 
-    variable = Expr(allometric_variable)
-    reference = Expr(reference_value)
+    variable = _parse_expr(allometric_variable)
+    reference = _parse_expr(reference_value)
 
     if parameters is not None:
         parsed_parameters = [Expr(p) for p in parameters]
@@ -111,11 +118,12 @@ def add_allometry(
 
         if initials is None:
             # Need to understand which parameter is CL or Q and which is V
+            cls_set, vcs_set = frozenset(cls), frozenset(vcs)
             initials = []
             for p in parsed_parameters:
-                if p in cls:
+                if p in cls_set:
                     initials.append(0.75)
-                elif p in vcs:
+                elif p in vcs_set:
                     initials.append(1.0)
 
     if not parsed_parameters:
@@ -130,6 +138,7 @@ def add_allometry(
         raise ValueError("The number of parameters, initials and bounds must be the same")
     sset = model.statements
     params = list(model.parameters)
+    insertions = {}
     for p, init, lower, upper in zip(parsed_parameters, initials, lower_bounds, upper_bounds):
         if not has_covariate_effect(model, str(p), str(variable)):
             symb = _create_symbol(
@@ -141,8 +150,15 @@ def add_allometry(
             new_ass = Assignment.create(p, expr)
             ind = sset.find_assignment_index(p)
             assert ind is not None
-            sset = sset[0 : ind + 1] + new_ass + sset[ind + 1 :]
-    model = model.replace(statements=sset, parameters=Parameters.create(params))
+            insertions.setdefault(ind, []).append(new_ass)
+
+    new_statements = []
+    for i, s in enumerate(sset):
+        new_statements.append(s)
+        new_statements.extend(insertions.get(i, ()))
+    model = model.replace(
+        statements=Statements(new_statements), parameters=Parameters.create(params)
+    )
     model = model.update_source()
 
     return model
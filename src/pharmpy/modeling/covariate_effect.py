@@ -8,6 +8,7 @@ import math
 import re
 import warnings
 from collections import defaultdict
+from functools import lru_cache
 from operator import add, mul
 from typing import Literal, Union
 
@@ -71,6 +72,7 @@ def get_covariate_effects(model: Model) -> dict[list]:
 def _get_covariate_effect(model: Model, symbol, covariate):
     param_expr = model.statements.before_odes.full_expression(symbol)
     param_expr = sympy.sympify(param_expr)
+    covariate_name = str(covariate)
     covariate = sympy.sympify(covariate)
 
     etas = tuple(sympy.sympify(e) for e in model.random_variables.etas.symbols)
@@ -116,24 +118,13 @@ def _get_covariate_effect(model: Model, symbol, covariate):
                     perform_matching = True
     if perform_matching:
         for effect in ['lin', 'cat', 'cat2', 'piece_lin', 'exp', 'pow']:
-            template = _create_template(effect, model, str(covariate))
-            template = template.template.expression
-            template = sympy.sympify(template)
-            wild_dict = defaultdict(list)
-            for s in template.free_symbols:
-                wild_symbol = sympy.Wild(str(s))
-                template = template.subs({s: wild_symbol})
-                if str(s).startswith("theta"):
-                    wild_dict["theta"].append(wild_symbol)
-                elif str(s).startswith("cov"):
-                    wild_dict["cov"].append(wild_symbol)
-                elif str(s).startswith("median"):
-                    wild_dict["median"].append(wild_symbol)
+            template = _create_template(effect, model, covariate_name)
+            template, wild_dict = _create_wild_template(template.template.expression)
 
             cov_expression = sympy.sympify(cov_expression)
             match = cov_expression.match(template)
             if match:
-                if _assert_cov_effect_match(wild_dict, match, model, str(covariate), effect):
+                if _assert_cov_effect_match(wild_dict, match, model, covariate_name, effect):
                     return effect, op
 
     if cov_expression:
@@ -142,6 +133,26 @@ def _get_covariate_effect(model: Model, symbol, covariate):
     return None, None
 
 
+@lru_cache(maxsize=64)
+def _create_wild_template(expression):
+    # NOTE: The templates are shared between calls (see _linear_template etc.)
+    # so the matching pattern only needs to be built once per template
+    template = sympy.sympify(expression)
+    wild_dict = defaultdict(list)
+    wilds = {}
+    for s in template.free_symbols:
+        name = str(s)
+        wild_symbol = sympy.Wild(name)
+        wilds[s] = wild_symbol
+        if name.startswith("theta"):
+            wild_dict["theta"].append(wild_symbol)
+        elif name.startswith("cov"):
+            wild_dict["cov"].append(wild_symbol)
+        elif name.startswith("median"):
+            wild_dict["median"].append(wild_symbol)
+    return template.subs(wilds), dict(wild_dict)
+
+
 def _assert_cov_effect_match(symbols, match, model, covariate, effect):
     if effect == "pow":
         if (
@@ -406,24 +417,25 @@ def add_covariate_effect(
 
     """
     sset = model.statements
+    covariate = str(covariate)
 
     if not allow_nested and depends_on(model, parameter, covariate):
         warnings.warn(f'Covariate effect of {covariate} on {parameter} already exists')
         return model
 
-    statistics = {}
-    statistics['mean'] = _calculate_mean(model.dataset, covariate)
-    statistics['median'] = _calculate_median(model, covariate)
-    statistics['std'] = _calculate_std(model, covariate)
+    statistics = _calculate_statistics(model, covariate)
 
     covariate_effect = _create_template(effect, model, covariate)
-    pset, thetas = _create_thetas(model, parameter, effect, covariate, covariate_effect.template)
+    pset, thetas = _create_thetas(
+        model, parameter, effect, covariate, covariate_effect.template, statistics['median']
+    )
     covariate_effect.apply(parameter, covariate, thetas, statistics)
     # NOTE: We hoist the statistic statements to avoid referencing variables
     # before declaring them. We also avoid duplicate statements.
     sset = [s for s in covariate_effect.statistic_statements if s not in sset] + sset
 
-    if has_mu_reference(model):
+    mu_reference = has_mu_reference(model)
+    if mu_reference:
         mu_symbol = get_mu_connected_to_parameter(model, parameter)
         last_existing_parameter_assignment = sset.find_assignment(mu_symbol)
     else:
@@ -445,7 +457,11 @@ def add_covariate_effect(
         Expr.symbol(f'{parameter}{col_name}') for col_name in model.datainfo.names
     }
 
-    if has_mu_reference(model):
+    # NOTE: Replaced statements directly precede the insertion point. They are
+    # counted here and removed in the same splice that inserts the new statements.
+    removed = 0
+
+    if mu_reference:
         mu_assignment = sset.find_assignment(mu_symbol)
         parameter_assignment = sset.find_assignment(parameter)
 
@@ -464,8 +480,7 @@ def add_covariate_effect(
         )[0]
 
         statements[-1] = Assignment.create(effect_statement.symbol, new_mu_expression)
-        sset = sset[0 : insertion_index - 1] + sset[insertion_index:]
-        insertion_index -= 1
+        removed += 1
 
     # NOTE: This is a heuristic that simplifies the NONMEM statements by
     # grouping multiple effect statements in a single statement.
@@ -478,9 +493,8 @@ def add_covariate_effect(
                 {parameter: last_existing_parameter_assignment.expression},
             ),
         )
-        sset = sset[0 : insertion_index - 1] + sset[insertion_index:]
-        insertion_index -= 1
-    sset = sset[0:insertion_index] + statements + sset[insertion_index:]
+        removed += 1
+    sset = sset[0 : insertion_index - removed] + statements + sset[insertion_index:]
     model = model.replace(parameters=pset, statements=sset)
     return model.update_source()
 
@@ -490,7 +504,9 @@ def natural_order(string, _nsre=re.compile(r'([0-9]+)')):
     return [int(key) if key.isdigit() else (key.lower(), key) for key in _nsre.split(string)]
 
 
-def _create_thetas(model, parameter, effect, covariate, template, _ctre=re.compile(r'theta\d*')):
+def _create_thetas(
+    model, parameter, effect, covariate, template, cov_median=None, _ctre=re.compile(r'theta\d*')
+):
     """Creates theta parameters and adds to parameter set of model.
 
     Number of parameters depends on how many thetas have been declared."""
@@ -501,8 +517,12 @@ def _create_thetas(model, parameter, effect, covariate, template, _ctre=re.compi
 
     theta_names = {}
 
+    # NOTE: The statistics only depend on the covariate so they are calculated
+    # once for all thetas
+    cov_stats = _calculate_bound_statistics(model, covariate, cov_median)
+
     if no_of_thetas == 1:
-        inits = _choose_param_inits(effect, model, covariate)
+        inits = _choose_param_inits(effect, model, covariate, cov_stats=cov_stats)
 
         theta_name = f'POP_{parameter}{covariate}'
         pset = Parameters.create(
@@ -511,7 +531,7 @@ def _create_thetas(model, parameter, effect, covariate, template, _ctre=re.compi
         theta_names['theta'] = theta_name
     else:
         for i, new_theta in enumerate(sorted(new_thetas, key=natural_order), 1):
-            inits = _choose_param_inits(effect, model, covariate, i)
+            inits = _choose_param_inits(effect, model, covariate, i, cov_stats)
 
             theta_name = f'POP_{parameter}{covariate}_{i}'
             pset = Parameters.create(
@@ -525,12 +545,11 @@ def _create_thetas(model, parameter, effect, covariate, template, _ctre=re.compi
 def _count_categorical(model, covariate):
     """Gets the number of individuals that has a level of categorical covariate."""
     idcol = model.datainfo.id_column.name
-    df = model.dataset.set_index(idcol)
-    allcounts = df[covariate].groupby('ID').value_counts()
-    allcounts.name = None  # To avoid collisions when resetting index
-    counts = allcounts.reset_index().iloc[:, 1].value_counts()
+    df = model.dataset
+    # NOTE: Each unique (ID, level) pair is one individual having that level
+    counts = df[[idcol, covariate]].drop_duplicates()[covariate].value_counts()
     counts.sort_index(inplace=True)  # To make deterministic in case of multiple modes
-    if model.dataset[covariate].isna().any():
+    if df[covariate].hasnans:
         counts[np.nan] = 0
     return counts
 
@@ -539,42 +558,59 @@ def _calculate_mean(df, covariate, baselines=False):
     """Calculate mean. Can be set to use baselines, otherwise it is
     calculated first per individual, then for the group."""
     if baselines:
-        return df[str(covariate)].mean()
+        return df[covariate].mean()
     else:
-        return df.groupby('ID')[str(covariate)].mean().mean()
+        return df.groupby('ID')[covariate].mean().mean()
 
 
 def _calculate_median(model, covariate, baselines=False):
     """Calculate median. Can be set to use baselines, otherwise it is
     calculated first per individual, then for the group."""
     if baselines:
-        return get_baselines(model)[str(covariate)].median()
+        return get_baselines(model)[covariate].median()
     else:
         df = model.dataset
-        return df.groupby('ID')[str(covariate)].median().median()
+        return df.groupby('ID')[covariate].median().median()
 
 
 def _calculate_std(model, covariate, baselines=False):
     """Calculate median. Can be set to use baselines, otherwise it is
     calculated first per individual, then for the group."""
     if baselines:
-        return get_baselines(model)[str(covariate)].std()
+        return get_baselines(model)[covariate].std()
     else:
         df = model.dataset
-        return df.groupby('ID')[str(covariate)].mean().std()
+        return df.groupby('ID')[covariate].mean().std()
+
+
+def _calculate_statistics(model, covariate):
+    """Calculate mean, median and standard deviation of a covariate from a
+    single grouping of the dataset. Same as calling _calculate_mean,
+    _calculate_median and _calculate_std without baselines."""
+    per_id = model.dataset.groupby('ID')[covariate]
+    means = per_id.mean()
+    return {'mean': means.mean(), 'median': per_id.median().median(), 'std': means.std()}
 
 
-def _choose_param_inits(effect, model, covariate, index=None):
+def _calculate_bound_statistics(model, covariate, cov_median=None):
+    """Calculate median, min and max of a covariate used for choosing bounds."""
+    if cov_median is None:
+        cov_median = _calculate_median(model, covariate)
+    column = model.dataset[covariate]
+    return cov_median, column.min(), column.max()
+
+
+def _choose_param_inits(effect, model, covariate, index=None, cov_stats=None):
     """Chooses inits for parameters. If the effect is exponential, the
-    bounds need to be dynamic."""
-    df = model.dataset
+    bounds need to be dynamic. Precalculated (median, min, max) statistics
+    can be passed to avoid calculating them again."""
     init_default = 0.001
 
     inits = {}
 
-    cov_median = _calculate_median(model, covariate)
-    cov_min = df[str(covariate)].min()
-    cov_max = df[str(covariate)].max()
+    if cov_stats is None:
+        cov_stats = _calculate_bound_statistics(model, covariate)
+    cov_median, cov_min, cov_max = cov_stats
 
     lower, upper = _choose_bounds(effect, cov_median, cov_min, cov_max, index)
 
@@ -599,82 +635,75 @@ def _choose_param_inits(effect, model, covariate, index=None):
     return inits
 
 
-def _choose_bounds(effect, cov_median, cov_min, cov_max, index=None):
-    if effect == 'exp':
-        min_diff = cov_min - cov_median
-        max_diff = cov_max - cov_median
+_EXP_LOWER_EXPECTED = 0.01
+_EXP_UPPER_EXPECTED = 100
+_LOG10_EXP_LOWER = math.log10(_EXP_LOWER_EXPECTED)
+_LOG10_EXP_UPPER = math.log10(_EXP_UPPER_EXPECTED)
 
-        lower_expected = 0.01
-        upper_expected = 100
 
-        if min_diff == 0 or max_diff == 0:
-            return lower_expected, upper_expected
-        else:
-            log_base = 10
-            lower = max(
-                math.log(lower_expected, log_base) / max_diff,
-                math.log(upper_expected, log_base) / min_diff,
-            )
-            upper = min(
-                math.log(lower_expected, log_base) / min_diff,
-                math.log(upper_expected, log_base) / max_diff,
-            )
-    elif effect == 'lin':
-        if cov_median == cov_min:
-            upper = 100000
-        else:
-            upper = 1 / (cov_median - cov_min)
-        if cov_median == cov_max:
-            lower = -100000
-        else:
-            lower = 1 / (cov_median - cov_max)
-    elif effect == 'piece_lin':
-        if cov_median == cov_min or cov_median == cov_max:
-            raise Exception(
-                'Median cannot be same as min or max, cannot use '
-                'piecewise-linear parameterization.'
-            )
-        if index == 0:
-            lower = -100000
-            upper = 1 / (cov_median - cov_min)
-        else:
-            lower = 1 / (cov_median - cov_max)
-            upper = 100000
-    elif effect == 'pow':
-        lower = -100
+def _exp_bounds(cov_median, cov_min, cov_max, index):
+    min_diff = cov_min - cov_median
+    max_diff = cov_max - cov_median
+
+    if min_diff == 0 or max_diff == 0:
+        return _EXP_LOWER_EXPECTED, _EXP_UPPER_EXPECTED
+    else:
+        lower = max(_LOG10_EXP_LOWER / max_diff, _LOG10_EXP_UPPER / min_diff)
+        upper = min(_LOG10_EXP_LOWER / min_diff, _LOG10_EXP_UPPER / max_diff)
+    return lower, upper
+
+
+def _lin_bounds(cov_median, cov_min, cov_max, index):
+    if cov_median == cov_min:
         upper = 100000
-    elif effect == 'cat':
-        lower = -1
-        upper = 5
-    elif effect == 'cat2':
-        lower = 0
-        upper = 6
     else:
+        upper = 1 / (cov_median - cov_min)
+    if cov_median == cov_max:
         lower = -100000
+    else:
+        lower = 1 / (cov_median - cov_max)
+    return lower, upper
+
+
+def _piece_lin_bounds(cov_median, cov_min, cov_max, index):
+    if cov_median == cov_min or cov_median == cov_max:
+        raise Exception(
+            'Median cannot be same as min or max, cannot use piecewise-linear parameterization.'
+        )
+    if index == 0:
+        lower = -100000
+        upper = 1 / (cov_median - cov_min)
+    else:
+        lower = 1 / (cov_median - cov_max)
         upper = 100000
+    return lower, upper
+
+
+_BOUNDS_FUNCS = {'exp': _exp_bounds, 'lin': _lin_bounds, 'piece_lin': _piece_lin_bounds}
+_CONSTANT_BOUNDS = {'pow': (-100, 100000), 'cat': (-1, 5), 'cat2': (0, 6)}
+_DEFAULT_BOUNDS = (-100000, 100000)
+
+
+def _choose_bounds(effect, cov_median, cov_min, cov_max, index=None):
+    bounds_func = _BOUNDS_FUNCS.get(effect)
+    if bounds_func is None:
+        lower, upper = _CONSTANT_BOUNDS.get(effect, _DEFAULT_BOUNDS)
+    else:
+        lower, upper = bounds_func(cov_median, cov_min, cov_max, index)
     return round(lower, 4), round(upper, 4)
 
 
 def _create_template(effect, model, covariate):
     """Creates Covariate class objects with effect template."""
-    if effect == 'lin':
-        return CovariateEffect.linear()
-    elif effect == 'cat':
+    if effect == 'cat' or effect == 'cat2':
         counts = _count_categorical(model, covariate)
-        return CovariateEffect.categorical(counts)
-    elif effect == 'cat2':
-        counts = _count_categorical(model, covariate)
-        return CovariateEffect.categorical(counts, alternative=True)
-    elif effect == 'piece_lin':
-        return CovariateEffect.piecewise_linear()
-    elif effect == 'exp':
-        return CovariateEffect.exponential()
-    elif effect == 'pow':
-        return CovariateEffect.power()
-    else:
-        symbol = Expr.symbol('symbol')
-        expression = parse_expr(effect)
-        return CovariateEffect(Assignment.create(symbol, expression))
+        return CovariateEffect.categorical(counts, alternative=effect == 'cat2')
+    template_factory = _TEMPLATE_FACTORIES.get(effect)
+    if template_factory is not None:
+        return template_factory()
+    symbol = Expr.symbol('symbol')
+    expression = parse_expr(effect)
+    return CovariateEffect(Assignment.create(symbol, expression))
 
 
 class CovariateEffect:
@@ -698,29 +727,23 @@ class CovariateEffect:
 
     def apply(self, parameter, covariate, thetas, statistics):
         effect_name = f'{parameter}{covariate}'
-        theta_subs = self.template.expression.subs(thetas)
-        cov_subs = theta_subs.subs({'cov': covariate})
+        template_names = {symbol.name for symbol in self.template.expression.free_symbols}
+
+        # NOTE: All substitutions are collected so that the expression is only
+        # traversed once
+        substitutions = {**thetas, 'cov': covariate}
+        for statistic in ('mean', 'median', 'std'):
+            if statistic in template_names:
+                statistic_name = f'{covariate}_{statistic.upper()}'
+                substitutions[statistic] = statistic_name
+                s = Assignment.create(Expr.symbol(statistic_name), statistics[statistic])
+                self.statistic_statements.append(s)
 
         self.template = Assignment.create(
             Expr(effect_name),
-            cov_subs,
+            self.template.expression.subs(substitutions),
         )
 
-        template_str = [str(symbol) for symbol in self.template.free_symbols]
-
-        if 'mean' in template_str:
-            self.template = self.template.subs({'mean': f'{covariate}_MEAN'})
-            s = Assignment.create(Expr.symbol(f'{covariate}_MEAN'), statistics['mean'])
-            self.statistic_statements.append(s)
-        if 'median' in template_str:
-            self.template = self.template.subs({'median': f'{covariate}_MEDIAN'})
-            s = Assignment.create(Expr.symbol(f'{covariate}_MEDIAN'), statistics['median'])
-            self.statistic_statements.append(s)
-        if 'std' in template_str:
-            self.template = self.template.subs({'std': f'{covariate}_STD'})
-            s = Assignment.create(Expr.symbol(f'{covariate}_STD'), statistics['std'])
-            self.statistic_statements.append(s)
-
     def create_effect_statement(self, operation_str, statement_original):
         """Creates statement for addition or multiplication of covariate
         to parameter, e.g. (if parameter is CL and covariate is WGT):
@@ -738,98 +761,117 @@ class CovariateEffect:
     @staticmethod
     def _get_operation(operation_str):
         """Gets sympy operation based on string"""
-        if operation_str == '*':
-            return mul
-        elif operation_str == '+':
-            return add
-
-        raise NotImplementedError(f'Can only handle + or *, got {operation_str}.')
+        try:
+            return _OPERATIONS[operation_str]
+        except KeyError:
+            raise NotImplementedError(f'Can only handle + or *, got {operation_str}.')
 
     @classmethod
     def linear(cls):
         """Linear continuous template (for continuous covariates)."""
-        symbol = Expr.symbol('symbol')
-        expression = 1 + Expr.symbol('theta') * (Expr.symbol('cov') - Expr.symbol('median'))
-        template = Assignment.create(symbol, expression)
-
-        return cls(template)
+        return cls(_linear_template())
 
     @classmethod
     def categorical(cls, counts, alternative=False):
         """Linear categorical template (for categorical covariates)."""
-        symbol = Expr.symbol('symbol')
-        most_common = counts.idxmax()
-        categories = list(counts.index)
-
-        values = [1]
-        conditions = [BooleanExpr.eq(Expr.symbol('cov'), most_common)]
-
-        for i, cat in enumerate(categories, 1):
-            if cat != most_common:
-                if np.isnan(cat):
-                    conditions += [BooleanExpr.eq(Expr.symbol('cov'), Expr.symbol('NaN'))]
-                    values += [1]
-                else:
-                    conditions += [BooleanExpr.eq(Expr.symbol('cov'), cat)]
-                    if len(categories) == 2:
-                        if alternative:
-                            values += [Expr.symbol('theta')]
-                        else:
-                            values += [1 + Expr.symbol('theta')]
-                    else:
-                        if alternative:
-                            values += [Expr.symbol(f'theta{i}')]
-                        else:
-                            values += [1 + Expr.symbol(f'theta{i}')]
-
-        expression = Expr.piecewise(*zip(values, conditions))
-
-        template = Assignment.create(symbol, expression)
-
-        return cls(template)
+        categories = tuple(counts.index)
+        # NOTE: Category types are part of the cache key since 1 == 1.0 but they are
+        # printed differently in the model code
+        types = tuple(type(cat) for cat in categories)
+        return cls(_categorical_template(counts.idxmax(), categories, alternative, types))
 
     @classmethod
     def piecewise_linear(cls):
         """Piecewise linear ("hockey-stick") template (for continuous
         covariates)."""
-        symbol = Expr.symbol('symbol')
-        values = [
-            1 + Expr.symbol('theta1') * (Expr.symbol('cov') - Expr.symbol('median')),
-            1 + Expr.symbol('theta2') * (Expr.symbol('cov') - Expr.symbol('median')),
-        ]
-        conditions = [
-            BooleanExpr.le(Expr.symbol('cov'), Expr.symbol('median')),
-            BooleanExpr.gt(Expr.symbol('cov'), Expr.symbol('median')),
-        ]
-        expression = Expr.piecewise((values[0], conditions[0]), (values[1], conditions[1]))
-
-        template = Assignment.create(symbol, expression)
-
-        return cls(template)
+        return cls(_piecewise_linear_template())
 
     @classmethod
     def exponential(cls):
         """Exponential template (for continuous covariates)."""
-        symbol = Expr.symbol('symbol')
-        expression = Expr.exp(Expr.symbol('theta') * (Expr.symbol('cov') - Expr.symbol('median')))
-        template = Assignment.create(symbol, expression)
-
-        return cls(template)
+        return cls(_exponential_template())
 
     @classmethod
     def power(cls):
         """Power template (for continuous covariates)."""
-        symbol = Expr.symbol('symbol')
-        expression = (Expr.symbol('cov') / Expr.symbol('median')) ** Expr.symbol('theta')
-        template = Assignment.create(symbol, expression)
-
-        return cls(template)
+        return cls(_power_template())
 
     def __str__(self):
         """String representation of class."""
         return str(self.template)
 
 
+_OPERATIONS = {'*': mul, '+': add}
+
+_TEMPLATE_FACTORIES = {
+    'lin': CovariateEffect.linear,
+    'piece_lin': CovariateEffect.piecewise_linear,
+    'exp': CovariateEffect.exponential,
+    'pow': CovariateEffect.power,
+}
+
+
+# NOTE: The templates below are immutable and identical for every call, so
+# they are built once and shared. CovariateEffect.apply rebinds its template
+# instead of mutating it.
+@lru_cache(maxsize=None)
+def _linear_template():
+    symbol = Expr.symbol('symbol')
+    expression = 1 + Expr.symbol('theta') * (Expr.symbol('cov') - Expr.symbol('median'))
+    return Assignment.create(symbol, expression)
+
+
+@lru_cache(maxsize=64, typed=True)
+def _categorical_template(most_common, categories, alternative, types):
+    symbol = Expr.symbol('symbol')
+
+    cov = Expr.symbol('cov')
+    cases = [(1, BooleanExpr.eq(cov, most_common))]
+
+    for i, cat in enumerate(categories, 1):
+        if cat != most_common:
+            if np.isnan(cat):
+                cases.append((1, BooleanExpr.eq(cov, Expr.symbol('NaN'))))
+            else:
+                theta = Expr.symbol('theta' if len(categories) == 2 else f'theta{i}')
+                value = theta if alternative else 1 + theta
+                cases.append((value, BooleanExpr.eq(cov, cat)))
+
+    expression = Expr.piecewise(*cases)
+
+    return Assignment.create(symbol, expression)
+
+
+@lru_cache(maxsize=None)
+def _piecewise_linear_template():
+    symbol = Expr.symbol('symbol')
+    values = [
+        1 + Expr.symbol('theta1') * (Expr.symbol('cov') - Expr.symbol('median')),
+        1 + Expr.symbol('theta2') * (Expr.symbol('cov') - Expr.symbol('median')),
+    ]
+    conditions = [
+        BooleanExpr.le(Expr.symbol('cov'), Expr.symbol('median')),
+        BooleanExpr.gt(Expr.symbol('cov'), Expr.symbol('median')),
+    ]
+    expression = Expr.piecewise((values[0], conditions[0]), (values[1], conditions[1]))
+
+    return Assignment.create(symbol, expression)
+
+
+@lru_cache(maxsize=None)
+def _exponential_template():
+    symbol = Expr.symbol('symbol')
+    expression = Expr.exp(Expr.symbol('theta') * (Expr.symbol('cov') - Expr.symbol('median')))
+    return Assignment.create(symbol, expression)
+
+
+@lru_cache(maxsize=None)
+def _power_template():
+    symbol = Expr.symbol('symbol')
+    expression = (Expr.symbol('cov') / Expr.symbol('median')) ** Expr.symbol('theta')
+    return Assignment.create(symbol, expression)
+
+
 def get_covariates_allowed_in_covariate_effect(model: Model) -> set[str]:
     try:
         di_covariate = model.datainfo.typeix['covariate'].names
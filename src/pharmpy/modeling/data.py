@@ -2078,7 +2078,10 @@ def create_default_datainfo(path_or_df):
 
 
 def deidentify_data(
-    df: pd.DataFrame, id_column: str = 'ID', date_columns: Optional[list[str]] = None
+    df: pd.DataFrame,
+    id_column: str = 'ID',
+    date_columns: Optional[list[str]] = None,
+    seed: Optional[Union[np.random.Generator, int]] = None,
 ):
     """Deidentify a dataset
 
@@ -2100,6 +2103,8 @@ def deidentify_data(
         Name of the id column
     date_columns : list
         Names of all date columns
+    seed : int or rng
+        Random number generator or seed. Default is to use a randomized seed.
 
     Returns
     -------
@@ -2108,7 +2113,7 @@ def deidentify_data(
     """
     df = df.copy()
     df[id_column] = pd.to_numeric(df[id_column])
-    resampler = resample_data(df, id_column)
+    resampler = resample_data(df, id_column, seed=seed)
     df, _ = next(resampler)
 
     if date_columns is None:
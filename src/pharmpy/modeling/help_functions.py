@@ -29,30 +29,40 @@ def _get_etas(model, list_of_etas, include_symbols=False, fixed_allowed=False, i
         list_of_etas = rvs.etas.names
         all_valid_etas = True
 
-    etas = []
+    # NOTE: Lookups are done once per call instead of once per requested name
+    dists = {name: dist for dist in rvs for name in dist.names}
+    eta_symbols = None
+
+    etas, seen = [], set()
     for eta_str in list_of_etas:
-        try:
-            eta = eta_str  # FIXME: upper/lower case sensitive in pharmpy but not in nonmem
-            if not fixed_allowed and _has_fixed_params(model, eta):
-                if not all_valid_etas:
-                    raise ValueError(f'Random variable cannot be set to fixed: {eta}')
-                continue
-            if not iov_allowed and rvs[eta].level == 'IOV':
-                if not all_valid_etas:
-                    raise ValueError(f'Random variable cannot be IOV: {eta}')
-                continue
-            if eta not in etas:
-                etas.append(eta)
-        except KeyError:
+        eta = eta_str  # FIXME: upper/lower case sensitive in pharmpy but not in nonmem
+        dist = dists.get(str(eta))
+        if dist is None:
             if include_symbols:
-                etas_symbs = _get_eta_symbs(eta_str, rvs, model.statements)
-                etas += [eta for eta in etas_symbs if eta not in etas]
+                if eta_symbols is None:
+                    eta_symbols = rvs.etas.free_symbols
+                etas_symbs = _get_eta_symbs(eta_str, eta_symbols, model.statements)
+                for eta in etas_symbs:
+                    if eta not in seen:
+                        seen.add(eta)
+                        etas.append(eta)
                 continue
             raise KeyError(f'Random variable does not exist: {eta_str}')
+        if not fixed_allowed and _has_fixed_params(model, dist):
+            if not all_valid_etas:
+                raise ValueError(f'Random variable cannot be set to fixed: {eta}')
+            continue
+        if not iov_allowed and dist.level == 'IOV':
+            if not all_valid_etas:
+                raise ValueError(f'Random variable cannot be IOV: {eta}')
+            continue
+        if eta not in seen:
+            seen.add(eta)
+            etas.append(eta)
     return etas
 
 
-def _get_eta_symbs(eta_str, rvs, sset):
+def _get_eta_symbs(eta_str, eta_symbols, sset):
     expr = sset.before_odes.full_expression(eta_str)
     if expr == Expr(eta_str):
         ass = sset.find_assignment(eta_str)
@@ -65,11 +75,11 @@ def _get_eta_symbs(eta_str, rvs, sset):
     #    exp_symbs = sset.before_odes.full_expression(eta_str).free_symbols
     # except AttributeError:
     #    raise KeyError(f'Symbol "{eta_str}" does not exist')
-    return [str(e) for e in exp_symbs.intersection(rvs.etas.free_symbols)]
+    return [str(e) for e in exp_symbs.intersection(eta_symbols)]
 
 
-def _has_fixed_params(model, rv):
-    param_names = model.random_variables[rv].parameter_names
+def _has_fixed_params(model, dist):
+    param_names = dist.parameter_names
 
     for p in model.parameters:
         if p.name in param_names and p.fix:
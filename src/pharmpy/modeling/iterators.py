@@ -20,6 +20,8 @@ from pharmpy.deps import pandas as pd
 from pharmpy.internals.math import round_and_keep_sum
 from pharmpy.model import Model
 
+from .parameter_sampling import create_rng
+
 
 class DatasetIterator:
     """Base class for iterator classes that generate new datasets from an input dataset
@@ -146,6 +148,7 @@ class Resample(DatasetIterator):
         without replacement
     :param name_pattern: Name to use for generated datasets. A number starting from 1 will
         be put in the placeholder.
+    :param seed: Random number generator or seed. Default is to use a randomized seed.
 
     :returns: A tuple of a resampled DataFrame and a list of resampled groups in order
     """
@@ -160,6 +163,7 @@ class Resample(DatasetIterator):
         replace=False,
         name_pattern='resample_{}',
         name=None,
+        seed=None,
     ):
         df = self._retrieve_dataset(dataset_or_model)
         unique_groups = df[group].unique()
@@ -173,18 +177,16 @@ class Resample(DatasetIterator):
             stratas = df.groupby(stratify)[group].unique()
             have_mult_sample_sizes = isinstance(sample_size, Mapping)
             if not have_mult_sample_sizes:
-                non_rounded_sample_sizes = stratas.apply(
-                    lambda x: (len(x) / numgroups) * sample_size
-                )
+                non_rounded_sample_sizes = (stratas.map(len) / numgroups) * sample_size
                 rounded_sample_sizes = round_and_keep_sum(non_rounded_sample_sizes, sample_size)
                 sample_size_dict = dict(rounded_sample_sizes)  # strata: numsamples
             else:
                 sample_size_dict = sample_size
 
-            stratas = dict(stratas)  # strata: list of groups
+            stratas = {strata: np.asarray(groups) for strata, groups in stratas.items()}
         else:
             sample_size_dict = {1: sample_size}
-            stratas = {1: unique_groups}
+            stratas = {1: np.asarray(unique_groups)}
 
         # Check that we will not run out of samples without replacement.
         if not replace:
@@ -205,9 +207,11 @@ class Resample(DatasetIterator):
 
         self._df = df
         self._group = group
+        self._group_frames = dict(iter(df.groupby(group, sort=False)))
         self._replace = replace
         self._stratas = stratas
         self._sample_size_dict = sample_size_dict
+        self._rng = create_rng(seed)
         if resamples > 1 and name:
             warnings.warn(
                 f'One name was provided despite having multiple resamples, falling back to '
@@ -221,27 +225,31 @@ class Resample(DatasetIterator):
     def __next__(self):
         self._check_exhausted()
 
-        random_groups = []
-        for strata in self._sample_size_dict:
-            random_groups += np.random.choice(  # pyright: ignore [reportOperatorIssue]
-                self._stratas[strata],
-                size=self._sample_size_dict[strata],
-                replace=self._replace,
-            ).tolist()
+        if self._sample_size_dict:
+            random_groups = np.concatenate(
+                [
+                    self._rng.choice(self._stratas[strata], size=size, replace=self._replace)
+                    for strata, size in self._sample_size_dict.items()
+                ]
+            )
+        else:
+            random_groups = np.array([], dtype=np.int64)
 
-        new_df = pd.DataFrame()
         # Build the dataset given the random_groups list
-        for grp_id, new_grp in zip(random_groups, range(1, len(random_groups) + 1)):
-            sub = self._df.loc[self._df[self._group] == grp_id].copy()
-            sub[self._group] = new_grp
-            new_df = pd.concat([new_df, sub])
-        new_df.reset_index(inplace=True, drop=True)
+        parts = [self._group_frames[grp_id] for grp_id in random_groups]
+        if parts:
+            new_df = pd.concat(parts, ignore_index=True)
+            new_df[self._group] = np.repeat(
+                np.arange(1, len(parts) + 1), [len(part) for part in parts]
+            )
+        else:
+            new_df = self._df.iloc[:0].copy()
         if self._name:
             new_df.name = self._name
         else:
             self._prepare_next(new_df)
 
-        return self._combine_dataset(new_df), random_groups
+        return self._combine_dataset(new_df), random_groups.tolist()
 
 
 def resample_data(
@@ -253,6 +261,7 @@ def resample_data(
     replace: bool = False,
     name_pattern: str = 'resample_{}',
     name: Optional[str] = None,
+    seed: Optional[Union[np.random.Generator, int]] = None,
 ):
     """Iterate over resamples of a dataset.
 
@@ -286,6 +295,8 @@ def resample_data(
         be put in the placeholder.
     name : str
         Option to name pattern in case of only one resample
+    seed : int or rng
+        Random number generator or seed. Default is to use a randomized seed.
 
     Returns
     -------
@@ -301,4 +312,5 @@ def resample_data(
         replace=replace,
         name_pattern=name_pattern,
         name=name,
+        seed=seed,
     )
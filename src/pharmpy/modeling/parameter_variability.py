@@ -4,10 +4,9 @@
 
 from __future__ import annotations
 
-import re
 import warnings
 from collections import Counter, defaultdict
-from functools import reduce
+from functools import lru_cache, reduce
 from itertools import chain, combinations
 from operator import add, mul
 from typing import Literal, Optional, Union
@@ -238,6 +237,12 @@ def add_iov(
                 'distribution != "explicit" requires parameters to be given as lists of strings'
             )
 
+    # NOTE: Check the occasion column before doing any work on the etas
+    categories = get_occasion_levels(model.dataset, occ)
+
+    if len(categories) == 1:
+        raise ValueError(f'Only one value in {occ} column.')
+
     if list_of_parameters is None:
         if distribution == 'disjoint':
             etas = list(map(lambda x: [x], _get_etas(model, None, include_symbols=True)))
@@ -264,17 +269,12 @@ def add_iov(
         for dist, grp in zip(etas, params):
             assert len(dist) <= len(grp)
 
-    categories = get_occasion_levels(model.dataset, occ)
-
     if eta_names and len(eta_names) != sum(map(len, etas)) * len(categories):
         raise ValueError(
             'Number of given eta names is incorrect, '
             f'need {sum(map(len, etas)) * len(categories)} names.'
         )
 
-    if len(categories) == 1:
-        raise ValueError(f'Only one value in {occ} column.')
-
     # NOTE: This declares the ETAS and their corresponding OMEGAs
     if distribution == 'same-as-iiv':
         # NOTE: We filter existing IIV distributions for selected ETAs and then
@@ -366,6 +366,7 @@ def _add_iov_explicit(model, occ, etas, categories, iov_name, etai_name, eta_nam
 
 def _add_iov_declare_etas(sset, occ, etas, indices, categories, eta_name, iov_name, etai_name):
     iovs, etais = [], []
+    occ_symbol = sympy.Symbol(occ)
 
     for i in indices:
         eta = etas[i - 1]
@@ -376,7 +377,7 @@ def _add_iov_declare_etas(sset, occ, etas, indices, categories, eta_name, iov_na
 
         expression = Expr.piecewise(
             *(
-                (sympy.Symbol(eta_name(i, k)), sympy.Eq(cat, sympy.Symbol(occ)))
+                (sympy.Symbol(eta_name(i, k)), sympy.Eq(cat, occ_symbol))
                 for k, cat in enumerate(categories, 1)
             )
         )
@@ -404,10 +405,10 @@ def _add_iov_etas_joint(rvs, pset, etas, indices, categories, omega_iov_name, et
     _add_iov_declare_diagonal_omegas(rvs, pset, etas, indices, omega_iov_name)
 
     # NOTE: Declare off-diagonal OMEGAs
+    paramset = Parameters.create(pset)
     for i, j in combinations(indices, r=2):
         omega_iov = Expr.symbol(omega_iov_name(i, j))
         omega_iiv = rvs.get_covariance(etas[i - 1], etas[j - 1])
-        paramset = Parameters.create(pset)  # FIXME!
         init = paramset[omega_iiv].init * 0.1 if omega_iiv != 0 and omega_iiv in paramset else 0.001
         pset.append(Parameter(str(omega_iov), init=init))
 
@@ -420,11 +421,13 @@ def _add_iov_etas_joint(rvs, pset, etas, indices, categories, omega_iov_name, et
 
 
 def _add_iov_declare_diagonal_omegas(rvs, pset, etas, indices, omega_iov_name):
+    # NOTE: The IIV variances are existing parameters so the lookup can be
+    # created once before appending the new IOV omegas
+    paramset = Parameters.create(pset)
     for i in indices:
         eta = etas[i - 1]
         omega_iiv = rvs[eta].get_variance(eta)
         omega_iov = Expr.symbol(omega_iov_name(i, i))
-        paramset = Parameters.create(pset)  # FIXME!
         init = paramset[omega_iiv].init * 0.1 if omega_iiv in paramset else 0.01
         pset.append(Parameter(str(omega_iov), init=init))
 
@@ -522,32 +525,44 @@ def add_pd_iiv(model: Model, initial_estimate: float = 0.09):
 
 
 def _create_template(expression, operation):
-    operation_func = _get_operation_func(operation)
-    if expression == 'add':
-        return EtaAddition.additive()
-    elif expression == 'prop':
-        return EtaAddition.proportional()
-    elif expression == 'exp':
-        return EtaAddition.exponential(operation_func)
-    elif expression == 'log':
-        return EtaAddition.logit()
-    elif expression == 're_log':
-        return EtaAddition.re_logit()
-    else:
-        expression = Expr(f'original {operation} {expression}')
-        return EtaAddition(expression)
+    if expression == 'exp':
+        return EtaAddition.exponential(_get_operation_func(operation))
+    template_factory = _ETA_ADDITION_FACTORIES.get(expression)
+    if template_factory is not None:
+        return template_factory()
+    return EtaAddition(_parse_eta_addition(operation, expression))
+
+
+@lru_cache(maxsize=128)
+def _parse_eta_addition(operation, expression):
+    # NOTE: The expression is parsed together with the operation so that
+    # operator precedence applies to the whole text, i.e. "*" with "eta_new + 1"
+    # gives original*eta_new + 1. Expr is immutable so the result can be shared.
+    return Expr(f'original {operation} {expression}')
+
+
+_OPERATIONS = {'*': mul, '+': add}
 
 
 def _get_operation_func(operation):
     """Gets operation based on string"""
-    if operation == '*':
-        return mul
-    elif operation == '+':
-        return add
+    return _OPERATIONS.get(operation)
 
 
 def get_occasion_levels(df, occ):
     levels = df[occ].unique()
+    # NOTE: Numeric levels can be truncated and sorted in one vectorized step.
+    # This gives the same result as canonicalizing each level separately as long
+    # as all float levels are finite and fit in an int64.
+    if isinstance(levels, np.ndarray) and (
+        levels.dtype.kind in 'iu'
+        or (
+            levels.dtype.kind == 'f'
+            and np.isfinite(levels).all()
+            and (np.abs(levels) < 2.0**63).all()
+        )
+    ):
+        return np.sort(levels.astype(np.int64)).tolist()
     return _canonicalize_categories(levels)
 
 
@@ -620,6 +635,14 @@ class EtaAddition:
         return cls(template)
 
 
+_ETA_ADDITION_FACTORIES = {
+    'add': EtaAddition.additive,
+    'prop': EtaAddition.proportional,
+    'log': EtaAddition.logit,
+    're_log': EtaAddition.re_logit,
+}
+
+
 def remove_iiv(model: Model, to_remove: Optional[Union[list[str], str]] = None):
     """
     Removes all IIV etas given a list with eta names and/or parameter names.
@@ -929,7 +952,8 @@ def _create_new_thetas(model, transformation, no_of_thetas):
         pset.append(Parameter(theta_name, *param_settings))
         thetas['theta1'] = theta_name
     else:
-        theta_no = int(re.findall(r'\d', theta_name)[0])
+        # NOTE: create_symbol returns the stem followed by the number
+        theta_no = int(theta_name[len(transformation) :])
 
         for i in range(1, no_of_thetas + 1):
             pset.append(Parameter(theta_name, 0.01, -3, 3))
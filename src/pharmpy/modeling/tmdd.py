@@ -459,13 +459,15 @@ def set_tmdd(
                 )
 
         # Add proportional error model
-        if Expr.symbol('Y_TARGET') in list(model.dependent_variables):
+        # NOTE: Setting the error model does not change the dependent variables
+        dv_symbols = set(model.dependent_variables)
+        if Expr.symbol('Y_TARGET') in dv_symbols:
             model = set_proportional_error_model(model, dv=dv_types['target'])
-        if Expr.symbol('Y_COMPLEX') in list(model.dependent_variables):
+        if Expr.symbol('Y_COMPLEX') in dv_symbols:
             model = set_proportional_error_model(model, dv=dv_types['complex'])
-        if Expr.symbol('Y') in list(model.dependent_variables) and 'drug_tot' in dv_types.keys():
+        if Expr.symbol('Y') in dv_symbols and 'drug_tot' in dv_types:
             model = set_proportional_error_model(model, dv=dv_types['drug_tot'])
-        if Expr.symbol('Y_TOTTARGET') in list(model.dependent_variables):
+        if Expr.symbol('Y_TOTTARGET') in dv_symbols:
             model = set_proportional_error_model(model, dv=dv_types['target_tot'])
 
         if model.dataset is not None:
@@ -518,5 +520,5 @@ def _get_y_symbol(model):
     else:
         sset = model.statements.direct_dependencies(y_statement)
         for s in sset:
-            if Expr.symbol("t") in s.free_symbols:
+            if t in s.free_symbols:
                 return s.symbol
@@ -41,13 +41,8 @@ def _parse_modelfit_results(
 
     log = Log()
     ext_path = path.with_suffix('.ext')
-    if not ext_path.is_file():
-        msg = f"Couldn't find NONMEM .ext-file at {ext_path}"
-        log = log.log_error(msg)
-        if strict:
-            raise FileNotFoundError(msg)
-        return create_failed_results(model, log)
-
+    # NOTE: A missing .ext-file is detected when reading it instead of
+    # probing the file system first
     try:
         try:
             ext_tables = NONMEMTableFile(ext_path)
@@ -63,9 +58,19 @@ def _parse_modelfit_results(
                     f"Broken table in ext-file {path.with_suffix('.ext')}, "
                     f"table no. {table.number}"
                 )
-    except (FileNotFoundError, OSError):
-        # FIXME: Can this still happen?
-        return None
+    except OSError as e:
+        # NOTE: Opening a directory raises PermissionError on Windows
+        missing = isinstance(e, (FileNotFoundError, IsADirectoryError, NotADirectoryError)) or (
+            isinstance(e, PermissionError) and ext_path.is_dir()
+        )
+        if not missing:
+            # FIXME: Can this still happen?
+            return None
+        msg = f"Couldn't find NONMEM .ext-file at {ext_path}"
+        log = log.log_error(msg)
+        if strict:
+            raise FileNotFoundError(msg)
+        return create_failed_results(model, log)
 
     (
         table_numbers,
@@ -5,6 +5,7 @@ import subprocess
 import time
 import uuid
 import warnings
+from functools import lru_cache
 from itertools import repeat
 from pathlib import Path
 from tempfile import mkdtemp
@@ -18,8 +19,6 @@ from pharmpy.workflows import ModelEntry
 
 from .parafile import create_parafile
 
-PARENT_DIR = f'..{os.path.sep}'
-
 
 def execute_model(model_entry, context):
     assert isinstance(model_entry, ModelEntry)
@@ -55,16 +54,19 @@ def execute_model(model_entry, context):
     # generated files such as results.lst.
     # NOTE: It is important that we do this in a DB-agnostic way so that we do
     # not depent on its implementation.
-    depth = relative_dataset_path.count(PARENT_DIR)
+    parts = Path(relative_dataset_path).parts
+    depth = 0
+    while depth < len(parts) and parts[depth] == os.pardir:
+        depth += 1
     # NOTE: This creates an FS tree branch x/x/x/x/...
     model_path = path.joinpath(*repeat('x', depth))
     meta = model_path / '.pharmpy'
     meta.mkdir(parents=True, exist_ok=True)
     # NOTE: This removes the leading ../
-    relative_dataset_path_suffix = relative_dataset_path[len(PARENT_DIR) * depth :]
+    relative_dataset_path_parts = parts[depth:]
     # NOTE: We do not support non-leading ../, e.g. a/b/../c
-    assert PARENT_DIR not in relative_dataset_path_suffix
-    dataset_path = path / Path(relative_dataset_path_suffix)
+    assert os.pardir not in relative_dataset_path_parts
+    dataset_path = path.joinpath(*relative_dataset_path_parts)
     datasets_path = dataset_path.parent
     datasets_path.mkdir(parents=True, exist_ok=True)
 
@@ -119,10 +121,15 @@ def execute_model(model_entry, context):
         modelfit_results=modelfit_results, simulation_results=simulation_results, log=log
     )
 
+    # NOTE: One listing of the run directory instead of a stat per result file
+    with os.scandir(model_path) as entries:
+        result_files = {entry.name for entry in entries if entry.is_file()}
+    base_path = model_path / basename
+
     with database.transaction(model_entry) as txn:
         if (
-            not (model_path / basename).with_suffix('.lst').is_file()
-            or not (model_path / basename).with_suffix('.ext').is_file()
+            base_path.with_suffix('.lst').name not in result_files
+            or base_path.with_suffix('.ext').name not in result_files
         ):
             context.log_warning(
                 'Expected result files do not exist, copying everything', model=model_entry.model
@@ -131,8 +138,9 @@ def execute_model(model_entry, context):
                 txn.store_local_file(file)
         else:
             for suffix in ('.lst', '.ext', '.phi', '.cov', '.cor', '.coi', '.grd', '.ets'):
-                file_path = (model_path / basename).with_suffix(suffix)
-                txn.store_local_file(file_path)
+                file_path = base_path.with_suffix(suffix)
+                if file_path.name in result_files:
+                    txn.store_local_file(file_path)
 
             for rec in model.internals.control_stream.get_records('TABLE'):
                 txn.store_local_file(model_path / rec.path)
@@ -158,11 +166,17 @@ def execute_model(model_entry, context):
 
 
 def nmfe_path():
+    # NOTE: The lookup is cached on the configured path and PATH so that the
+    # file system is only probed again if either of them changes
+    return _nmfe_path(conf.default_nonmem_path, os.environ.get('PATH'))
+
+
+@lru_cache(maxsize=4)
+def _nmfe_path(default_path, search_path):
     if os.name == 'nt':
         nmfe_candidates = ('nmfe76.bat', 'nmfe75.bat', 'nmfe74.bat', 'nmfe73.bat')
     else:
         nmfe_candidates = ('nmfe76', 'nmfe75', 'nmfe74', 'nmfe73')
-    default_path = conf.default_nonmem_path
     if default_path != Path(''):
         path = default_path / 'run'
         for nmfe in nmfe_candidates:
@@ -175,7 +189,7 @@ def nmfe_path():
     else:
         # Not in configuration file
         for nmfe in nmfe_candidates:
-            candidate_path = shutil.which(nmfe)
+            candidate_path = shutil.which(nmfe, path=search_path)
             if candidate_path is not None:
                 path = candidate_path
                 break
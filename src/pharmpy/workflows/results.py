@@ -5,12 +5,12 @@ import json
 import lzma
 import re
 import warnings
-from contextlib import closing
 from dataclasses import dataclass
+from functools import lru_cache
 from io import StringIO
 from lzma import open as lzma_open
-from pathlib import Path
-from typing import TYPE_CHECKING, Any, Literal, Optional, Union, overload
+from pathlib import Path, PosixPath, WindowsPath
+from typing import TYPE_CHECKING, Any, Literal, Optional, TextIO, Union, overload
 
 import pharmpy
 from pharmpy.deps import altair as alt
@@ -44,68 +44,116 @@ def _index_to_json(index: Union[pd.Index, pd.MultiIndex]) -> dict[str, Any]:
     return {'__class__': 'Index', **_df_to_json(index.to_frame(index=False))}
 
 
+def _encode_results(obj: Results) -> dict[str, Any]:
+    d = obj.to_dict()
+    d['__module__'] = obj.__class__.__module__
+    d['__class__'] = obj.__class__.__qualname__
+    return d
+
+
+def _encode_df(obj: pd.DataFrame) -> dict[str, Any]:
+    d = _df_to_json(obj)
+    d['__class__'] = 'DataFrame'
+    return d
+
+
+def _encode_series(obj: pd.Series) -> dict[str, Any]:
+    if obj.size >= 1 and isinstance(obj.iloc[0], pd.DataFrame):
+        # NOTE: Hack special case for Series of DataFrame objects
+        return {
+            'data': [{'__class__': 'DataFrame', **_df_to_json(df)} for df in obj.values],
+            'index': _index_to_json(obj.index),
+            'name': obj.name,
+            'dtype': str(obj.dtype),
+            '__class__': 'Series[DataFrame]',
+        }
+
+    # NOTE: Hack to work around poor support of to_json/read_json of
+    # pd.Series with MultiIndex
+    df = obj.to_frame()
+    d = _df_to_json(df)
+    d['__class__'] = 'Series'
+    return d
+
+
+def _encode_altair(obj) -> dict[str, Any]:
+    with warnings.catch_warnings():
+        # FIXME: Remove filter once altair stops relying on deprecated APIs
+        warnings.filterwarnings(
+            "ignore",
+            message=".*iteritems is deprecated and will be removed in a future version. Use .items instead.",
+            category=FutureWarning,
+        )
+        # This was fixed in altair v2.1.1 can be removed once we require that version
+        warnings.filterwarnings(
+            "ignore",
+            message=".*the convert_dtype parameter is deprecated",
+            category=FutureWarning,
+        )
+        d = obj.to_dict()
+    d['__module__'] = obj.__class__.__module__
+    d['__class__'] = obj.__class__.__qualname__
+    return d
+
+
+def _encode_model(obj: Model) -> None:
+    # TODO: Consider using other representation, e.g. path
+    return None
+
+
+def _encode_log(obj: Log) -> dict[str, Any]:
+    d: dict[Any, Any] = obj.to_dict()
+    d['__class__'] = obj.__class__.__qualname__
+    return d
+
+
+def _encode_path(obj: Path) -> dict[str, Any]:
+    return {'path': str(obj), '__class__': 'PosixPath'}
+
+
+@lru_cache(maxsize=None)
+def _json_encoders():
+    # NOTE: Built on first use to keep pandas lazily imported and to avoid a
+    # circular import of Log
+    from pharmpy.workflows import Log
+
+    return {
+        pd.DataFrame: _encode_df,
+        pd.Series: _encode_series,
+        Log: _encode_log,
+        PosixPath: _encode_path,
+        WindowsPath: _encode_path,
+    }
+
+
 class ResultsJSONEncoder(json.JSONEncoder):
     def default(self, obj) -> Union[dict[str, Any], None]:
         # NOTE: This function is called when the base JSONEncoder does not know
         # how to encode the given object, so it will not be called on int,
         # float, str, list, tuple, and dict. It could be called on set for
         # instance, or any custom class.
-        from pharmpy.workflows import Log
+        encoder = _json_encoders().get(type(obj))
+        if encoder is not None:
+            return encoder(obj)
 
+        # NOTE: Fall back to isinstance checks for subclasses
         if isinstance(obj, Results):
-            d = obj.to_dict()
-            d['__module__'] = obj.__class__.__module__
-            d['__class__'] = obj.__class__.__qualname__
-            return d
-        elif isinstance(obj, pd.DataFrame):
-            d = _df_to_json(obj)
-            d['__class__'] = 'DataFrame'
-            return d
+            return _encode_results(obj)
+
+        from pharmpy.workflows import Log
+
+        if isinstance(obj, pd.DataFrame):
+            return _encode_df(obj)
         elif isinstance(obj, pd.Series):
-            if obj.size >= 1 and isinstance(obj.iloc[0], pd.DataFrame):
-                # NOTE: Hack special case for Series of DataFrame objects
-                return {
-                    'data': [{'__class__': 'DataFrame', **_df_to_json(df)} for df in obj.values],
-                    'index': _index_to_json(obj.index),
-                    'name': obj.name,
-                    'dtype': str(obj.dtype),
-                    '__class__': 'Series[DataFrame]',
-                }
-
-            # NOTE: Hack to work around poor support of to_json/read_json of
-            # pd.Series with MultiIndex
-            df = obj.to_frame()
-            d = _df_to_json(df)
-            d['__class__'] = 'Series'
-            return d
+            return _encode_series(obj)
         elif obj.__class__.__module__.startswith('altair.'):
-            with warnings.catch_warnings():
-                # FIXME: Remove filter once altair stops relying on deprecated APIs
-                warnings.filterwarnings(
-                    "ignore",
-                    message=".*iteritems is deprecated and will be removed in a future version. Use .items instead.",
-                    category=FutureWarning,
-                )
-                # This was fixed in altair v2.1.1 can be removed once we require that version
-                warnings.filterwarnings(
-                    "ignore",
-                    message=".*the convert_dtype parameter is deprecated",
-                    category=FutureWarning,
-                )
-                d = obj.to_dict()
-            d['__module__'] = obj.__class__.__module__
-            d['__class__'] = obj.__class__.__qualname__
-            return d
+            return _encode_altair(obj)
         elif isinstance(obj, Model):
-            # TODO: Consider using other representation, e.g. path
-            return None
+            return _encode_model(obj)
         elif isinstance(obj, Log):
-            d: dict[Any, Any] = obj.to_dict()
-            d['__class__'] = obj.__class__.__qualname__
-            return d
+            return _encode_log(obj)
         elif isinstance(obj, Path):
-            d = {'path': str(obj), '__class__': 'PosixPath'}
-            return d
+            return _encode_path(obj)
         else:
             # NOTE: This will raise a proper TypeError
             return super().default(obj)
@@ -119,13 +167,70 @@ def _df_read_json(obj) -> pd.DataFrame:
             row['time'] = pd.to_datetime(row['time']).tz_localize(None)
             row['time'] = row['time'].isoformat()
 
+    df = _table_to_df(obj)
+    if df is not None:
+        return df
     return pd.read_json(StringIO(json.dumps(obj)), typ='frame', orient='table', precise_float=True)
 
 
+# NOTE: Table schema field types that map directly onto a numpy dtype
+_TABLE_FIELD_DTYPES = {
+    'integer': 'int64',
+    'number': 'float64',
+    'boolean': 'bool',
+    'string': 'object',
+    'any': 'object',
+}
+
+
+def _table_to_df(obj) -> Optional[pd.DataFrame]:
+    # NOTE: Builds the frame directly from an already decoded table orient
+    # dict, in the same way as pandas' parse_table_schema. Returns None for
+    # field types needing pandas' own conversion, e.g. datetimes and categoricals.
+    schema = obj['schema']
+    fields = schema['fields']
+    dtypes = {}
+    for field in fields:
+        if 'constraints' in field or 'extDtype' in field:
+            return None
+        dtype = _TABLE_FIELD_DTYPES.get(field['type'])
+        if dtype is None:
+            return None
+        dtypes[field['name']] = dtype
+
+    columns = [field['name'] for field in fields]
+    df = pd.DataFrame(obj['data'], columns=columns).astype(dtypes)
+
+    if 'primaryKey' in schema:
+        df = df.set_index(schema['primaryKey'])
+        if len(df.index.names) == 1:
+            if df.index.name == 'index':
+                df.index.name = None
+        else:
+            df.index.names = [
+                None if name.startswith('level_') else name for name in df.index.names
+            ]
+
+    return df
+
+
 def _multi_index_read_json(obj) -> pd.MultiIndex:
     return pd.MultiIndex.from_frame(_df_read_json(obj))
 
 
+@lru_cache(maxsize=None)
+def _results_class(module: Optional[str], cls: str):
+    if module is None:
+        # NOTE: Kept for backwards compatibility: we guess the module
+        # path based on the class name.
+        tool_name = cls[:-7].lower()  # NOTE: Trim "Results" suffix
+        tool_module = importlib.import_module(f'pharmpy.tools.{tool_name}')
+        return tool_module.results_class
+    else:
+        tool_module = importlib.import_module(module)
+        return getattr(tool_module, cls)
+
+
 class ResultsJSONDecoder(json.JSONDecoder):
     def __init__(self, *args, **kwargs):
         json.JSONDecoder.__init__(self, object_hook=self.object_hook, *args, **kwargs)
@@ -185,17 +290,7 @@ class ResultsJSONDecoder(json.JSONDecoder):
             return class_.from_dict(obj, validate=False)
 
         if cls is not None and cls.endswith('Results'):
-            if module is None:
-                # NOTE: Kept for backwards compatibility: we guess the module
-                # path based on the class name.
-                tool_name = cls[:-7].lower()  # NOTE: Trim "Results" suffix
-                tool_module = importlib.import_module(f'pharmpy.tools.{tool_name}')
-                results_class = tool_module.results_class
-            else:
-                tool_module = importlib.import_module(module)
-                results_class = getattr(tool_module, cls)
-
-            return results_class.from_dict(obj)
+            return _results_class(module, cls).from_dict(obj)
 
         if cls == 'PosixPath':
             return Path(obj)
@@ -216,19 +311,32 @@ def _is_likely_to_be_json(source: str):
 
 def read_results(path_or_str: Union[str, Path]):
     if isinstance(path_or_str, str) and _is_likely_to_be_json(path_or_str):
-        manager = closing(StringIO(path_or_str))
+        return json.loads(path_or_str, cls=ResultsJSONDecoder)
+
+    path = Path(path_or_str)
+    if path.is_dir():
+        path /= 'results.json'
+
+    # NOTE: The raw bytes are read in one go and decoded by json.loads instead
+    # of going through a text wrapper
+    if path.name.endswith('.xz'):
+        with lzma.open(path, 'rb') as fh:
+            data = fh.read()
     else:
-        path = Path(path_or_str)
-        if path.is_dir():
-            path /= 'results.json'
+        data = path.read_bytes()
+
+    return json.loads(data, cls=ResultsJSONDecoder)
 
-        if path.name.endswith('.xz'):
-            manager = lzma.open(path, 'r', encoding='utf-8')
-        else:
-            manager = open(path, 'r')
 
-    with manager as readable:
-        return json.load(readable, cls=ResultsJSONDecoder)
+_REMOVED_KEYS = frozenset(
+    (
+        '__version__',
+        'best_model',  # NOTE: Was removed in d5b3503 and 8578c8b
+        'input_model',  # NOTE: Was removed in d5b3503 and 8578c8b
+        'summary_individuals',  # NOTE: Was removed in 5873fe9
+        'summary_individuals_count',  # NOTE: Was removed in 5873fe9
+    )
+)
 
 
 @dataclass(frozen=True)
@@ -240,16 +348,9 @@ class Results(Immutable):
     @classmethod
     def from_dict(cls, d: dict[str, Any]):
         """Create results object from dictionary"""
-        removed_keys = {
-            '__version__',
-            'best_model',  # NOTE: Was removed in d5b3503 and 8578c8b
-            'input_model',  # NOTE: Was removed in d5b3503 and 8578c8b
-            'summary_individuals',  # NOTE: Was removed in 5873fe9
-            'summary_individuals_count',  # NOTE: Was removed in 5873fe9
-        }
         return cls(
             __version__=d.get('__version__', 'unknown'),  # NOTE: Override default version
-            **{k: v for k, v in d.items() if k not in removed_keys},
+            **{k: v for k, v in d.items() if k not in _REMOVED_KEYS},
         )
 
     @overload
@@ -273,17 +374,20 @@ class Results(Immutable):
         str
             Json as string unless path was used
         """
-        s = ResultsJSONEncoder().encode(self)
+        encoder = ResultsJSONEncoder()
         if path:
+            # NOTE: Write chunks as they are encoded to avoid keeping the full json in memory
             if not lzma:
                 with open(path, 'w') as fh:
-                    fh.write(s)
+                    for chunk in encoder.iterencode(self):
+                        fh.write(chunk)
             else:
                 xz_path = path.parent / (path.name + '.xz')
-                with lzma_open(xz_path, 'w') as fh:
-                    fh.write(bytes(s, 'utf-8'))
+                with lzma_open(xz_path, 'wt', encoding='utf-8') as fh:
+                    for chunk in encoder.iterencode(self):
+                        fh.write(chunk)
         else:
-            return s
+            return encoder.encode(self)
 
     def get_and_reset_index(self, attr: str, **kwargs) -> pd.DataFrame:
         """Wrapper to reset index of attribute or result from method.
@@ -303,24 +407,15 @@ class Results(Immutable):
 
     def __str__(self):
         start = self.__class__.__name__
-        s = f'{start}\n\n'
-        d = self.to_dict()
-        for key, value in d.items():
-            if value.__class__.__module__.startswith('altair.'):
+        s = [f'{start}\n\n']
+        formatters = _str_formatters()
+        for key, value in vars(self).items():
+            if type(value).__module__.startswith('altair.'):
                 continue
-            s += f'{key}\n'
-            if isinstance(value, pd.DataFrame):
-                s += value.to_string()
-            elif isinstance(value, list):  # Print list of lists as table
-                if len(value) > 0 and isinstance(value[0], list):
-                    df = pd.DataFrame(value)
-                    df_str = df.to_string(index=False)
-                    df_str = df_str.split('\n')[1:]
-                    s += '\n'.join(df_str)
-            else:
-                s += str(value) + '\n'
-            s += '\n\n'
-        return s
+            s.append(f'{key}\n')
+            s.append(_lookup_by_type(formatters, value, _value_to_str)(value))
+            s.append('\n\n')
+        return ''.join(s)
 
     def to_csv(self, path: Path):
         """Save results as a human readable csv file
@@ -332,39 +427,76 @@ class Results(Immutable):
         path : Path
             Path to csv-file
         """
-        d = self.to_dict()
-        s = ""
-        for key, value in d.items():
-            if value.__class__.__module__.startswith('altair.'):
-                continue
-            elif isinstance(value, Model):
-                continue
-            elif isinstance(value, ModelfitResults):
-                continue
-            elif isinstance(value, list) and isinstance(value[0], Model):
-                continue
-            s += f'{key}\n'
-            if isinstance(value, pd.DataFrame):
-                if isinstance(value.index, pd.RangeIndex):
-                    use_index = False
-                else:
-                    use_index = True
-                csv = value.to_csv(index=use_index)
-                assert isinstance(csv, str)
-                s += csv
-            elif isinstance(value, pd.Series):
-                csv = value.to_csv()
-                assert isinstance(csv, str)
-                s += csv
-            elif isinstance(value, list):  # Print list of lists as table
-                if len(value) > 0 and isinstance(value[0], list):
-                    for row in value:
-                        s += f'{",".join(map(str, row))}\n'
-            else:
-                s += str(value) + '\n'
-            s += '\n'
+        writers = _csv_writers()
         with open(path, 'w', newline='') as fh:
-            print(s, file=fh)
+            for key, value in vars(self).items():
+                if type(value).__module__.startswith('altair.'):
+                    continue
+                elif isinstance(value, Model):
+                    continue
+                elif isinstance(value, ModelfitResults):
+                    continue
+                elif isinstance(value, list) and isinstance(value[0], Model):
+                    continue
+                fh.write(f'{key}\n')
+                _lookup_by_type(writers, value, _write_value)(value, fh)
+                fh.write('\n')
+            fh.write('\n')
+
+
+def _value_to_str(value) -> str:
+    return str(value) + '\n'
+
+
+def _list_to_str(value: list) -> str:
+    # NOTE: Print list of lists as table
+    if len(value) > 0 and isinstance(value[0], list):
+        df_str = pd.DataFrame(value).to_string(index=False).split('\n')[1:]
+        return '\n'.join(df_str)
+    return ''
+
+
+def _write_value(value, fh: TextIO):
+    fh.write(_value_to_str(value))
+
+
+def _write_list_csv(value: list, fh: TextIO):
+    # NOTE: Print list of lists as table
+    if len(value) > 0 and isinstance(value[0], list):
+        for row in value:
+            fh.write(f'{",".join(map(str, row))}\n')
+
+
+def _write_df_csv(df: pd.DataFrame, fh: TextIO):
+    # NOTE: Write directly to the file to avoid creating a copy of large tables as strings
+    use_index = not isinstance(df.index, pd.RangeIndex)
+    df.to_csv(fh, index=use_index)
+
+
+def _write_series_csv(series: pd.Series, fh: TextIO):
+    series.to_csv(fh)
+
+
+def _lookup_by_type(table: dict, value, default):
+    # NOTE: Exact types are looked up directly, subclasses fall back to isinstance
+    func = table.get(type(value))
+    if func is not None:
+        return func
+    for cls, func in table.items():
+        if isinstance(value, cls):
+            return func
+    return default
+
+
+@lru_cache(maxsize=None)
+def _str_formatters():
+    # NOTE: Built on first use to keep pandas lazily imported
+    return {pd.DataFrame: pd.DataFrame.to_string, list: _list_to_str}
+
+
+@lru_cache(maxsize=None)
+def _csv_writers():
+    return {pd.DataFrame: _write_df_csv, pd.Series: _write_series_csv, list: _write_list_csv}
 
 
 @dataclass(frozen=True)
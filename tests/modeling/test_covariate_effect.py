@@ -36,6 +36,20 @@ def test_nan_add_covariate_effect(load_model_for_test, pheno_path):
     assert re.search(r'NEW_COL\.EQ\.-99', model.code)
 
 
+def test_add_covariate_effect_categorical_dtypes(load_model_for_test, pheno_path):
+    model = load_model_for_test(pheno_path)
+    data = model.dataset.copy()
+    data['C1'] = ([1, 2] * len(data.index))[: len(data.index)]
+
+    model_int = model.replace(dataset=data.astype({'C1': 'int32'}))
+    model_int = add_covariate_effect(model_int, 'CL', 'C1', 'cat')
+    assert re.search(r'C1\.EQ\.1(?!\.)', model_int.code)
+
+    model_float = model.replace(dataset=data.astype({'C1': 'float64'}))
+    model_float = add_covariate_effect(model_float, 'CL', 'C1', 'cat')
+    assert re.search(r'C1\.EQ\.1\.0', model_float.code)
+
+
 def test_nested_add_covariate_effect(load_model_for_test, testdata):
     model_path = testdata / 'nonmem' / 'pheno.mod'
     model = load_model_for_test(model_path)
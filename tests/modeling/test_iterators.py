@@ -1,4 +1,3 @@
-import numpy as np
 import pandas.testing
 import pytest
 
@@ -36,13 +35,12 @@ def test_omit(df):
 
 
 def test_resampler_default(df):
-    np.random.seed(28)
-    resampler = iters.Resample(df, 'ID')
+    resampler = iters.Resample(df, 'ID', seed=28)
     (new_df, ids) = next(resampler)
-    assert ids == [1, 4, 2]
+    assert ids == [4, 2, 1]
     assert list(new_df['ID']) == [1, 1, 2, 2, 3, 3]
-    assert list(new_df['DV']) == [5, 6, 0, 9, 3, 4]
-    assert list(new_df['STRAT']) == [1, 1, 2, 2, 2, 2]
+    assert list(new_df['DV']) == [0, 9, 3, 4, 5, 6]
+    assert list(new_df['STRAT']) == [2, 2, 2, 2, 1, 1]
     assert new_df.name == 'resample_1'
     with pytest.raises(StopIteration):  # Test the default one iteration
         next(resampler)
@@ -54,51 +52,65 @@ def test_resampler_too_big_sample_size(df):
 
 
 def test_resampler_noreplace(df):
-    np.random.seed(28)
-    resampler = iters.Resample(df, 'ID', replace=False, sample_size=3)
+    resampler = iters.Resample(df, 'ID', replace=False, sample_size=3, seed=28)
     next(resampler)
 
-    resampler = iters.Resample(df, 'ID', stratify='STRAT')
+    resampler = iters.Resample(df, 'ID', stratify='STRAT', seed=28)
     (new_df, ids) = next(resampler)
     assert ids == [1, 2, 4]
     assert list(new_df['ID']) == [1, 1, 2, 2, 3, 3]
     assert list(new_df['DV']) == [5, 6, 3, 4, 0, 9]
 
-    resampler = iters.Resample(df, 'ID', replace=False, sample_size=2)
+    resampler = iters.Resample(df, 'ID', replace=False, sample_size=2, seed=28)
     (new_df, ids) = next(resampler)
-    assert list(ids) == [2, 1]
+    assert list(ids) == [4, 2]
     assert list(new_df['ID']) == [1, 1, 2, 2]
 
 
+def test_resampler_empty_sample(df):
+    resampler = iters.Resample(df, 'ID', sample_size=0, seed=28)
+    (new_df, ids) = next(resampler)
+    assert ids == []
+    assert len(new_df) == 0
+    assert list(new_df.columns) == ['ID', 'DV', 'STRAT']
+    assert new_df.name == 'resample_1'
+
+
+def test_resampler_empty_strata_sample_sizes(df):
+    resampler = iters.Resample(df, 'ID', stratify='STRAT', sample_size={}, seed=28)
+    (new_df, ids) = next(resampler)
+    assert ids == []
+    assert len(new_df) == 0
+    assert list(new_df.columns) == ['ID', 'DV', 'STRAT']
+
+
 def test_stratification(df):
-    np.random.seed(28)
     resampler = iters.Resample(
-        df, 'ID', resamples=1, stratify='STRAT', sample_size={1: 2, 2: 3}, replace=True
+        df, 'ID', resamples=1, stratify='STRAT', sample_size={1: 2, 2: 3}, replace=True, seed=28
     )
     (new_df, ids) = next(resampler)
-    assert ids == [1, 1, 4, 4, 4]
+    assert ids == [1, 1, 4, 4, 2]
     assert list(new_df['ID']) == [1, 1, 2, 2, 3, 3, 4, 4, 5, 5]
-    assert list(new_df['DV']) == [5, 6, 5, 6, 0, 9, 0, 9, 0, 9]
+    assert list(new_df['DV']) == [5, 6, 5, 6, 0, 9, 0, 9, 3, 4]
 
     resampler = iters.Resample(
-        df, 'ID', resamples=1, stratify='STRAT', sample_size={1: 2}, replace=True
+        df, 'ID', resamples=1, stratify='STRAT', sample_size={1: 2}, replace=True, seed=28
     )
     (new_df, ids) = next(resampler)
     assert ids == [1, 1]
 
-    resampler = iters.Resample(df, 'ID', resamples=3, stratify='STRAT', replace=True)
+    resampler = iters.Resample(df, 'ID', resamples=3, stratify='STRAT', replace=True, seed=28)
     (new_df, ids) = next(resampler)
-    assert ids == [1, 2, 2]
+    assert ids == [1, 4, 4]
     (new_df, ids) = next(resampler)
     assert ids == [1, 2, 4]
     (new_df, ids) = next(resampler)
-    assert ids == [1, 4, 2]
+    assert ids == [1, 4, 4]
 
 
 def test_resampler_anonymization(testdata):
-    np.random.seed(28)
     df = pd.read_csv(testdata / 'pheno_data.csv')
-    resampler = iters.Resample(df, group='ID')
+    resampler = iters.Resample(df, group='ID', seed=28)
     (new_df, ids) = next(resampler)
     assert all(e in ids for e in range(1, 60))
     assert len(ids) == 59
@@ -109,3 +121,12 @@ def test_resampler_anonymization(testdata):
         df_oldid.reset_index(inplace=True, drop=True)
         df_newid['ID'] = old_id
         pandas.testing.assert_frame_equal(df_newid, df_oldid)
+
+
+def test_resampler_large_population():
+    df = pd.DataFrame({'ID': range(1, 20001), 'DV': range(20000)})
+    resampler = iters.Resample(df, 'ID', sample_size=5, seed=28)
+    (new_df, ids) = next(resampler)
+    assert len(set(ids)) == 5
+    assert list(new_df['ID']) == [1, 2, 3, 4, 5]
+    assert list(new_df['DV']) == [i - 1 for i in ids]
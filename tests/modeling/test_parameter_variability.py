@@ -6,6 +6,7 @@ from operator import add, mul
 import pytest
 
 from pharmpy.basic import Expr
+from pharmpy.deps import pandas as pd
 from pharmpy.internals.fs.cwd import chdir
 from pharmpy.model import Assignment, NormalDistribution
 from pharmpy.modeling import (
@@ -30,6 +31,7 @@ from pharmpy.modeling.parameter_variability import (
     EtaAddition,
     EtaTransformation,
     _choose_cov_param_init,
+    get_occasion_levels,
 )
 from pharmpy.tools import read_modelfit_results
 
@@ -509,6 +511,18 @@ def test_add_iov_compose(load_model_for_test, pheno_path):
     assert rec_omega_1 == rec_omega_2
 
 
+def test_get_occasion_levels():
+    df = pd.DataFrame({'OCC': [2.0, 1.0, 2.0, 1.5]})
+    assert get_occasion_levels(df, 'OCC') == [1, 1, 2]
+
+    df = pd.DataFrame({'OCC': [1.0, float('inf')]})
+    with pytest.raises(OverflowError):
+        get_occasion_levels(df, 'OCC')
+
+    df = pd.DataFrame({'OCC': [1.0, 1e20]})
+    assert get_occasion_levels(df, 'OCC') == [1, 10**20]
+
+
 def test_add_iov_only_one_level(load_model_for_test, pheno_path):
     model = load_model_for_test(pheno_path)
     df = model.dataset.copy()
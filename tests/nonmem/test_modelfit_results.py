@@ -306,6 +306,18 @@ def test_serialization(testdata):
     assert res.log.to_dataframe().equals(res_decode.log.to_dataframe())
 
 
+@pytest.mark.parametrize('lzma', [False, True])
+def test_serialization_to_file(testdata, tmp_path, lzma):
+    res = read_modelfit_results(testdata / 'nonmem' / 'models' / 'mox_2comp.mod')
+    path = tmp_path / 'results.json'
+    res.to_json(path, lzma=lzma)
+    if lzma:
+        path = tmp_path / 'results.json.xz'
+    res_decode = read_results(path)
+
+    assert res.parameter_estimates.equals(res_decode.parameter_estimates)
+
+
 def test_empty_results(testdata, pheno_path):
     model = read_model(pheno_path)
     res = parse_modelfit_results(
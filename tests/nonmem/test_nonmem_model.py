@@ -996,6 +996,51 @@ $TABLE      ID TIME AMT WGT APGR IPRED PRED TAD CWRES NPDE NOAPPEND
     model.update_source()
 
 
+def test_update_source_unchanged(pheno):
+    model = pheno.update_source()
+    assert model.update_source() is model
+
+
+def test_update_source_after_replace(pheno):
+    model = pheno.update_source()
+
+    parameters = model.parameters.set_initial_estimates({'PTVCL': 0.5})
+    updated = model.replace(parameters=parameters).update_source()
+    assert '$THETA (0,0.5) ; PTVCL' in updated.code
+
+    statements = model.statements + Assignment.create(S('NEWVAR'), S('IPRED'))
+    updated = model.replace(statements=statements).update_source()
+    assert 'NEWVAR = IPRED' in updated.code
+
+    dataset = model.dataset.copy()
+    dataset['DV'] = dataset['DV'] + 1
+    updated = model.replace(dataset=dataset).update_source()
+    assert 'DUMMYPATH' in updated.code
+    assert 'DUMMYPATH' not in model.code
+
+    datainfo = model.datainfo.set_column(model.datainfo['FA2'].replace(drop=True))
+    updated = model.replace(datainfo=datainfo).update_source()
+    assert 'FA2=DROP' in updated.code
+    assert 'FA2=DROP' not in model.code
+
+
+def test_update_source_first_update():
+    thetas = ' + '.join(f'THETA({i})' for i in range(1, 102))
+    code = (
+        "$PROBLEM base model\n$INPUT ID DV TIME\n$DATA file.csv IGNORE=@\n"
+        f"$PRED\nY = {thetas} + ETA(1) + ERR(1)\n"
+        + "$THETA 0.1\n" * 101
+        + "$OMEGA 0.01\n$SIGMA 1\n"
+    )
+    model = Model.parse_model_from_string(code)
+    assert model.internals.source_state is None
+    model = model.update_source()
+    first_line = model.code.split('\n')[0]
+    assert first_line.startswith('$SIZES')
+    assert 'LTH=101' in first_line
+    assert model.update_source() is model
+
+
 def test_convert_model(testdata):
     code = """$PROBLEM base model
 $INPUT ID DV TIME
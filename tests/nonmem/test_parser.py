@@ -73,6 +73,23 @@ def test_simple_parse():
     assert str(model2) == model2_str
 
 
+def test_get_records():
+    parser = NMTranParser()
+    code = '$PROBLEM P1\n$THETA 1\n$THETA 2\n$PROBLEM P2\n$THETA 3\n'
+    stream = parser.parse(code)
+
+    thetas = stream.get_records('THETA')
+    assert [str(rec) for rec in thetas] == ['$THETA 1\n', '$THETA 2\n']
+    thetas.pop()
+    assert len(stream.get_records('THETA')) == 2
+    assert [str(rec) for rec in stream.get_records('THETA', 1)] == ['$THETA 3\n']
+    assert stream.get_records('OMEGA') == []
+
+    new_stream = stream.remove_records(stream.get_records('THETA')[:1])
+    assert len(new_stream.get_records('THETA')) == 1
+    assert len(stream.get_records('THETA')) == 2
+
+
 def test_round_trip(pheno_path):
     parser = NMTranParser()
 
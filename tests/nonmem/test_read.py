@@ -107,6 +107,12 @@ def test_read_small_nonmem_datasets():
     df = read_nonmem_dataset(StringIO("1,2,"), colnames=abc, null_value=9)
     assert list(df.iloc[0]) == [1, 2, 9]
 
+    # Rows with fewer items than the first row
+    df = read_nonmem_dataset(StringIO("1 2 3\n4 5\n"), colnames=abc)
+    assert list(df.iloc[1]) == [4, 5, 0]
+    df = read_nonmem_dataset(StringIO("1,2,3\n4,5\n"), colnames=abc)
+    assert list(df.iloc[1]) == [4, 5, 0]
+
 
 def test_nonmem_dataset_with_nonunique_ids():
     colnames = ['ID', 'DV']
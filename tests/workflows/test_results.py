@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Any
+
+from pharmpy.deps import pandas as pd
+from pharmpy.workflows import Results
+
+
+class MyDataFrame(pd.DataFrame):
+    pass
+
+
+@dataclass(frozen=True)
+class MyResults(Results):
+    table: Any = None
+
+
+def test_str_dataframe_subclass():
+    df = MyDataFrame({'A': [1, 2], 'B': [3, 4]})
+    res = MyResults(table=df)
+    assert df.to_string() in str(res)
+
+
+def test_to_csv_dataframe_subclass(tmp_path):
+    df = MyDataFrame({'A': [1, 2], 'B': [3, 4]})
+    res = MyResults(table=df)
+    path = tmp_path / 'results.csv'
+    res.to_csv(path)
+    assert path.read_text() == 'table\nA,B\n1,3\n2,4\n\n\n'